@@ -0,0 +1,30 @@
+"""Color helpers shared by the GUI widgets."""
+from functools import lru_cache
+
+from PyQt6.QtGui import QColor
+
+
+@lru_cache(maxsize=128)
+def is_dark_color(hex_color: str) -> bool:
+    """Check if color is dark (for text contrast), caching the result per color string.
+    
+    Plain #rrggbb strings are parsed directly; anything else Qt understands
+    (named colors, #rgb, ...) goes through QColor.
+    
+    Args:
+        hex_color: Hex color string
+        
+    Returns:
+        True if color is dark
+    """
+    try:
+        if len(hex_color) != 7 or hex_color[0] != '#':
+            raise ValueError(hex_color)
+        red = int(hex_color[1:3], 16)
+        green = int(hex_color[3:5], 16)
+        blue = int(hex_color[5:7], 16)
+    except ValueError:
+        color = QColor(hex_color)
+        red, green, blue = color.red(), color.green(), color.blue()
+    luminance = (0.299 * red + 0.587 * green + 0.114 * blue) / 255
+    return luminance < 0.5
@@ -0,0 +1,62 @@
+"""Background worker for writing CSV exports."""
+from pathlib import Path
+from typing import Union
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+from ..models import Database
+from ..utils import export_session_rows_to_csv, format_session_export_rows
+
+
+class ExportSignals(QObject):
+    """Signals reporting the outcome of a background export."""
+    
+    finished = pyqtSignal(str, int)  # output path, rows written
+    failed = pyqtSignal(str)  # error message
+
+
+class SessionExportWorker(QRunnable):
+    """Writes a timer session CSV export on a thread pool thread.
+    
+    SQLite connections can't be shared between threads, so the worker reads
+    the sessions through its own read-only connection to the same database
+    file. It never runs schema setup, so it can't contend with the GUI
+    thread's writes.
+    """
+    
+    def __init__(self, db_path: str, start_date: str, end_date: str,
+                 output_path: Union[str, Path]):
+        """Initialize session export worker.
+        
+        Args:
+            db_path: Path to the SQLite database file
+            start_date: Start date ISO format
+            end_date: End date ISO format
+            output_path: Path to output CSV file
+        """
+        super().__init__()
+        self.db_path = db_path
+        self.start_date = start_date
+        self.end_date = end_date
+        self.output_path = output_path
+        # Created on the GUI thread, so connected slots run there too
+        self.signals = ExportSignals()
+    
+    def run(self):
+        """Stream the sessions from the database into the CSV file."""
+        try:
+            db = Database(self.db_path, read_only=True)
+            try:
+                count = export_session_rows_to_csv(
+                    format_session_export_rows(
+                        db.iter_sessions_for_export(self.start_date, self.end_date)
+                    ),
+                    self.output_path
+                )
+            finally:
+                db.close()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        
+        self.signals.finished.emit(str(self.output_path), count)
@@ -2,26 +2,179 @@
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
     QListWidget, QListWidgetItem, QLabel, QMessageBox, QFileDialog,
-    QTabWidget, QTextEdit, QGroupBox, QScrollArea, QGridLayout
+    QTabWidget, QPlainTextEdit, QGroupBox, QScrollArea, QGridLayout,
+    QDialog, QComboBox, QDialogButtonBox
 )
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QEvent, QThreadPool, QTimer, pyqtSlot
 from PyQt6.QtGui import QFont, QAction
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
 
-from ..models import Database, Task, TimerSession
+from ..models import Database, Task
 from ..utils import (
     format_duration, get_date_range_for_today, get_date_range_for_week,
     get_date_range_for_month, get_week_dates, format_date, format_datetime,
     export_daily_report_to_csv, export_weekly_report_to_csv,
-    export_sessions_to_csv, get_default_export_path, generate_export_filename
+    get_default_export_path, generate_export_filename
 )
+from .colors import is_dark_color
+from .export_worker import ExportSignals, SessionExportWorker
 from .task_dialog import TaskDialog
-from .timer_widget import TimerWidget
-from .preferences_dialog import PreferencesDialog
-from .preferences_dialog import PreferencesDialog
 from .preferences_dialog import PreferencesDialog
 
+# Debounce delays, display tick and report refresh period (milliseconds)
+DISPLAY_TICK_MS = 1000
+AUTOSAVE_DELAY_MS = 30000
+REPORT_REFRESH_DELAY_MS = 500
+REPORT_TICK_MS = 60000
+
+# How long closing the window waits for a background export to finish
+EXPORT_SHUTDOWN_TIMEOUT_MS = 5000
+
+# autosave() is still a placeholder: every change is committed to the
+# database as it happens, so don't wake the event loop just to call it
+AUTOSAVE_ENABLED = False
+
+# Built-in timers driven by the Work Day controls rather than task buttons
+SPECIAL_TIMER_NAMES = frozenset({"Work Day", "Lunch", "Break"})
+
+# Report layout: rules, separators, row formatters and static column headers
+DAILY_RULE = "=" * 60
+DAILY_SEPARATOR = "-" * 60
+DAILY_ROW = "{:<30} {:<12} {:<10}".format
+DAILY_COLUMNS = DAILY_ROW('Task', 'Time', 'Sessions')
+WEEKLY_RULE = "=" * 80
+WEEKLY_SEPARATOR = "-" * 80
+WEEKLY_ROW = "{:<15} {:<15} {:<20} {:<10}".format
+WEEKLY_COLUMNS = WEEKLY_ROW('Date', 'Total Time', 'Context Switches', 'Tasks')
+
+# Work Day button before the day has started
+WORK_DAY_IDLE_QSS = """
+    QPushButton {
+        background-color: #27ae60;
+        color: white;
+        border: 3px solid #229954;
+        border-radius: 8px;
+        padding: 10px;
+    }
+    QPushButton:hover {
+        background-color: #2ecc71;
+        border: 3px solid #27ae60;
+    }
+"""
+
+# Lunch/Break buttons before the day has started
+PAUSE_IDLE_QSS = """
+    QPushButton {
+        background-color: #f39c12;
+        color: white;
+        border: 3px solid #e67e22;
+        border-radius: 8px;
+        padding: 10px;
+    }
+    QPushButton:hover {
+        background-color: #f1c40f;
+        border: 3px solid #f39c12;
+    }
+"""
+
+# Work Day button while running (label includes the elapsed time)
+WORK_DAY_RUNNING_QSS = """
+    QPushButton {
+        background-color: #e74c3c;
+        color: white;
+        font-size: 11pt;
+        font-weight: bold;
+        border-radius: 8px;
+        min-width: 200px;
+        min-height: 50px;
+    }
+    QPushButton:hover {
+        background-color: #c0392b;
+    }
+"""
+
+# Lunch/Break buttons while running (label includes the elapsed time)
+PAUSE_RUNNING_QSS = """
+    QPushButton {
+        background-color: #e67e22;
+        color: white;
+        font-size: 10pt;
+        font-weight: bold;
+        border-radius: 8px;
+        min-width: 150px;
+        min-height: 50px;
+    }
+    QPushButton:hover {
+        background-color: #d35400;
+    }
+"""
+
+# Work Day button after the day has been stopped
+WORK_DAY_STOPPED_QSS = """
+    QPushButton {
+        background-color: #27ae60;
+        color: white;
+        font-size: 12pt;
+        font-weight: bold;
+        border-radius: 8px;
+        min-width: 200px;
+        min-height: 50px;
+    }
+    QPushButton:hover {
+        background-color: #229954;
+    }
+"""
+
+# Lunch/Break buttons after being stopped
+PAUSE_STOPPED_QSS = """
+    QPushButton {
+        background-color: #f39c12;
+        color: white;
+        font-size: 11pt;
+        font-weight: bold;
+        border-radius: 8px;
+        min-width: 150px;
+        min-height: 50px;
+    }
+    QPushButton:hover {
+        background-color: #e67e22;
+    }
+"""
+
+# Task button stylesheet template, filled in per color
+TASK_BUTTON_QSS = """
+    QPushButton {{
+        background-color: {color};
+        color: {text_color};
+        border: 2px solid {color};
+        border-radius: 5px;
+        font-size: 11pt;
+        font-weight: bold;
+        text-align: center;
+        padding: 10px;
+    }}
+    QPushButton:hover {{
+        background-color: {color};
+        border: 3px solid #2c3e50;
+    }}
+"""
+
+
+@lru_cache(maxsize=None)
+def task_button_stylesheet(button_color: str) -> str:
+    """Get the stylesheet for a task button, built once per color.
+    
+    Args:
+        button_color: Hex color string
+        
+    Returns:
+        Stylesheet string
+    """
+    text_color = 'white' if is_dark_color(button_color) else 'black'
+    return TASK_BUTTON_QSS.format(color=button_color, text_color=text_color)
+
 
 class MainWindow(QMainWindow):
     """Main application window."""
@@ -30,30 +183,50 @@ class MainWindow(QMainWindow):
         """Initialize main window."""
         super().__init__()
         self.db = Database()
-        self.active_timer_widgets: Dict[int, TimerWidget] = {}
         self.task_sessions: Dict[int, int] = {}  # task_id -> session_id for running tasks
-        self.setup_ui()
-        self.load_tasks()
-        self.load_active_timers()
+        self._special_task_ids: Dict[str, int] = {}  # Work Day/Lunch/Break name -> task_id
+        self._session_starts: Dict[int, datetime] = {}  # running session_id -> start time
+        # Last rendered report per tab, keyed on date range + DB change count
+        self._daily_cache: Dict[str, object] = {}
+        self._weekly_cache: Dict[str, object] = {}
+        # Session exports still being written, keyed by their signals object
+        self._export_workers: Dict[ExportSignals, SessionExportWorker] = {}
+        # Update task button displays every second while a timer is running
+        # and the window is visible; a coarse timer is plenty for a 1 Hz
+        # label refresh and lets Qt coalesce wakeups
+        self.display_timer = QTimer()
+        self.display_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self.display_timer.setInterval(DISPLAY_TICK_MS)
+        self.display_timer.timeout.connect(self.update_task_button_displays)
+        # Keep running totals in a shown report current; like the display
+        # tick it only runs while it has something to update
+        self.report_timer = QTimer()
+        self.report_timer.setInterval(REPORT_TICK_MS)
+        self.report_timer.timeout.connect(self.refresh_visible_reports)
         
-        # Check if we should auto-start Work Day
-        self.check_auto_start_work_day()
+        self.setup_ui()
+        # Tasks, running sessions and the auto-start preference in one read
+        task_rows, session_rows, expected_start_time = self.db.get_startup_snapshot()
+        self.load_tasks(task_rows)
+        self.load_active_timers(session_rows)
         
-        # Auto-save timer state every 30 seconds
+        # Auto-save once timer state has been quiet for a while after a change
         self.autosave_timer = QTimer()
+        self.autosave_timer.setSingleShot(True)
+        self.autosave_timer.setInterval(AUTOSAVE_DELAY_MS)
         self.autosave_timer.timeout.connect(self.autosave)
-        self.autosave_timer.start(30000)
         
-        # Update task button displays every second
-        self.display_timer = QTimer()
-        self.display_timer.timeout.connect(self.update_task_button_displays)
-        self.display_timer.start(1000)
+        # Coalesce report refreshes triggered by bursts of user actions
+        self.report_refresh_timer = QTimer()
+        self.report_refresh_timer.setSingleShot(True)
+        self.report_refresh_timer.setInterval(REPORT_REFRESH_DELAY_MS)
+        self.report_refresh_timer.timeout.connect(self.refresh_visible_reports)
         
-        # Update reports every minute
-        self.report_timer = QTimer()
-        self.report_timer.timeout.connect(self.update_reports)
-        self.report_timer.start(60000)
-        self.update_reports()
+        # Check if we should auto-start Work Day
+        self.check_auto_start_work_day(expected_start_time)
+        
+        # Build reports after the window's first paint rather than before it
+        QTimer.singleShot(0, self.refresh_visible_reports)
     
     def setup_ui(self):
         """Set up the user interface."""
@@ -76,19 +249,25 @@ class MainWindow(QMainWindow):
         main_layout.addWidget(self.tabs)
         
         # Timers tab
-        timers_tab = QWidget()
-        self.setup_timers_tab(timers_tab)
-        self.tabs.addTab(timers_tab, "Timers")
+        self.timers_tab = QWidget()
+        self.setup_timers_tab(self.timers_tab)
+        self.tabs.addTab(self.timers_tab, "Timers")
         
         # Daily report tab
-        daily_tab = QWidget()
-        self.setup_daily_report_tab(daily_tab)
-        self.tabs.addTab(daily_tab, "Daily Report")
+        self.daily_tab = QWidget()
+        self.setup_daily_report_tab(self.daily_tab)
+        self.tabs.addTab(self.daily_tab, "Daily Report")
         
         # Weekly report tab
-        weekly_tab = QWidget()
-        self.setup_weekly_report_tab(weekly_tab)
-        self.tabs.addTab(weekly_tab, "Weekly Report")
+        self.weekly_tab = QWidget()
+        self.setup_weekly_report_tab(self.weekly_tab)
+        self.tabs.addTab(self.weekly_tab, "Weekly Report")
+        
+        # Reports and task button labels are only refreshed while visible;
+        # catch up when their tab is shown
+        self.tabs.currentChanged.connect(self.refresh_visible_reports)
+        self.tabs.currentChanged.connect(self.update_task_button_displays)
+        self.tabs.currentChanged.connect(self._sync_report_timer)
         
         # Track special timer IDs
         self.work_day_session_id = None
@@ -153,19 +332,7 @@ class MainWindow(QMainWindow):
         font.setPointSize(12)
         font.setBold(True)
         self.work_day_button.setFont(font)
-        self.work_day_button.setStyleSheet("""
-            QPushButton {
-                background-color: #27ae60;
-                color: white;
-                border: 3px solid #229954;
-                border-radius: 8px;
-                padding: 10px;
-            }
-            QPushButton:hover {
-                background-color: #2ecc71;
-                border: 3px solid #27ae60;
-            }
-        """)
+        self.work_day_button.setStyleSheet(WORK_DAY_IDLE_QSS)
         self.work_day_button.clicked.connect(self.toggle_work_day)
         controls_layout.addWidget(self.work_day_button)
         
@@ -176,19 +343,7 @@ class MainWindow(QMainWindow):
         self.lunch_button.setMinimumHeight(50)
         self.lunch_button.setMinimumWidth(150)
         self.lunch_button.setFont(font)
-        self.lunch_button.setStyleSheet("""
-            QPushButton {
-                background-color: #f39c12;
-                color: white;
-                border: 3px solid #e67e22;
-                border-radius: 8px;
-                padding: 10px;
-            }
-            QPushButton:hover {
-                background-color: #f1c40f;
-                border: 3px solid #f39c12;
-            }
-        """)
+        self.lunch_button.setStyleSheet(PAUSE_IDLE_QSS)
         self.lunch_button.clicked.connect(self.toggle_lunch)
         self.lunch_button.setEnabled(False)  # Disabled until work day starts
         controls_layout.addWidget(self.lunch_button)
@@ -198,19 +353,7 @@ class MainWindow(QMainWindow):
         self.break_button.setMinimumHeight(50)
         self.break_button.setMinimumWidth(150)
         self.break_button.setFont(font)
-        self.break_button.setStyleSheet("""
-            QPushButton {
-                background-color: #f39c12;
-                color: white;
-                border: 3px solid #e67e22;
-                border-radius: 8px;
-                padding: 10px;
-            }
-            QPushButton:hover {
-                background-color: #f1c40f;
-                border: 3px solid #f39c12;
-            }
-        """)
+        self.break_button.setStyleSheet(PAUSE_IDLE_QSS)
         self.break_button.clicked.connect(self.toggle_break)
         self.break_button.setEnabled(False)  # Disabled until work day starts
         controls_layout.addWidget(self.break_button)
@@ -266,6 +409,7 @@ class MainWindow(QMainWindow):
         
         # Store task buttons for selection tracking
         self.task_buttons = {}
+        self._task_button_order: List[int] = []  # task ids in grid order
         self.selected_task_id = None
     
     def setup_daily_report_tab(self, parent: QWidget):
@@ -298,7 +442,7 @@ class MainWindow(QMainWindow):
         layout.addLayout(header_layout)
         
         # Report content
-        self.daily_report_text = QTextEdit()
+        self.daily_report_text = QPlainTextEdit()
         self.daily_report_text.setReadOnly(True)
         self.daily_report_text.setFont(QFont("Monospace", 10))
         layout.addWidget(self.daily_report_text)
@@ -338,77 +482,122 @@ class MainWindow(QMainWindow):
         layout.addLayout(header_layout)
         
         # Report content
-        self.weekly_report_text = QTextEdit()
+        self.weekly_report_text = QPlainTextEdit()
         self.weekly_report_text.setReadOnly(True)
         self.weekly_report_text.setFont(QFont("Monospace", 10))
         layout.addWidget(self.weekly_report_text)
     
-    def load_tasks(self):
-        """Load tasks from database and create task buttons in a grid."""
-        # Clear existing task buttons
-        for button in self.task_buttons.values():
-            self.tasks_grid_layout.removeWidget(button)
-            button.deleteLater()
-        self.task_buttons.clear()
+    def load_tasks(self, task_rows: Optional[Sequence] = None):
+        """Load tasks from database and sync task buttons in a grid.
         
-        tasks = self.db.get_all_tasks()
+        Buttons for tasks that still exist are updated in place; only added
+        or removed tasks create or delete widgets, and the grid is only
+        re-laid out when the set or order of tasks changed.
         
-        # Filter out special timers
-        special_timer_names = {"Work Day", "Lunch", "Break"}
+        Args:
+            task_rows: Active task rows if already fetched; otherwise they
+                are read from the database
+        """
+        if task_rows is None:
+            task_rows = self.db.get_all_tasks()
+        tasks = [Task.from_db_row(task_row) for task_row in task_rows]
         
-        # Calculate grid dimensions (3 columns)
-        columns = 3
-        row = 0
-        col = 0
+        # Filter out special timers
+        tasks = [task for task in tasks if task.name not in SPECIAL_TIMER_NAMES]
+        new_ids = [task.id for task in tasks]
         
-        for task_row in tasks:
-            task = Task.from_db_row(task_row)
-            
-            # Skip special timer tasks
-            if task.name in special_timer_names:
-                continue
-            
-            # Create button for task
-            button = QPushButton(f"Start {task.name}")
-            button.setMinimumHeight(80)
-            button.setMinimumWidth(150)
-            button.task_id = task.id  # Store task_id on button
-            button.task_name = task.name  # Store task name
-            button.task_color = task.color  # Store color
-            
-            # Style button with task color
-            text_color = 'white' if self.is_dark_color(task.color or "#3498db") else 'black'
-            button_color = task.color or "#3498db"
-            
-            button.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {button_color};
-                    color: {text_color};
-                    border: 2px solid {button_color};
-                    border-radius: 5px;
-                    font-size: 11pt;
-                    font-weight: bold;
-                    text-align: center;
-                    padding: 10px;
-                }}
-                QPushButton:hover {{
-                    background-color: {button_color};
-                    border: 3px solid #2c3e50;
-                }}
-            """)
+        # Suspend repaints while the grid is updated
+        self.tasks_widget.setUpdatesEnabled(False)
+        try:
+            # Remove buttons for tasks that no longer exist
+            for task_id in set(self.task_buttons) - set(new_ids):
+                self._remove_task_button(task_id)
             
-            # Connect button click to toggle timer
-            button.clicked.connect(lambda checked, tid=task.id: self.toggle_task_timer(tid))
+            for task in tasks:
+                if task.id in self.task_buttons:
+                    self._update_task_button(task)
+                else:
+                    self._create_task_button(task)
             
-            # Add to grid layout
-            self.tasks_grid_layout.addWidget(button, row, col)
-            self.task_buttons[task.id] = button
+            self._layout_task_buttons(new_ids)
+        finally:
+            self.tasks_widget.setUpdatesEnabled(True)
+    
+    def _create_task_button(self, task: Task) -> QPushButton:
+        """Create and register the button for a task (not yet placed in the grid).
+        
+        Args:
+            task: Task to create a button for
             
-            # Move to next position in grid
-            col += 1
-            if col >= columns:
-                col = 0
-                row += 1
+        Returns:
+            The new button
+        """
+        button = QPushButton(f"Start {task.name}")
+        button.setMinimumHeight(80)
+        button.setMinimumWidth(150)
+        button.task_id = task.id  # Store task_id on button
+        button.task_name = task.name  # Store task name
+        button.task_color = task.color  # Store color
+        button.setProperty("taskId", task.id)
+        
+        # Style button with task color (stylesheet shared per color)
+        button.setStyleSheet(task_button_stylesheet(task.color or "#3498db"))
+        
+        # All task buttons share one slot that reads the task id back
+        button.clicked.connect(self._on_task_button_clicked)
+        self.task_buttons[task.id] = button
+        return button
+    
+    def _update_task_button(self, task: Task):
+        """Update an existing task button's label and color, touching only what changed.
+        
+        Args:
+            task: Task with the current name and color
+        """
+        button = self.task_buttons[task.id]
+        if button.task_name != task.name:
+            button.task_name = task.name
+            verb = "Stop" if task.id in self.task_sessions else "Start"
+            button.setText(f"{verb} {task.name}")
+        if button.task_color != task.color:
+            button.task_color = task.color
+            button.setStyleSheet(task_button_stylesheet(task.color or "#3498db"))
+    
+    def _remove_task_button(self, task_id: int):
+        """Remove a task's button from the grid and schedule it for deletion.
+        
+        Args:
+            task_id: Task ID
+        """
+        button = self.task_buttons.pop(task_id)
+        self.tasks_grid_layout.removeWidget(button)
+        button.deleteLater()
+    
+    def _layout_task_buttons(self, task_ids: List[int]):
+        """Place task buttons in the grid (3 columns) if the order changed.
+        
+        Args:
+            task_ids: Task IDs in display order
+        """
+        if task_ids == self._task_button_order:
+            return
+        
+        # Hold off geometry passes until every button is placed
+        self.tasks_grid_layout.setEnabled(False)
+        try:
+            for task_id in task_ids:
+                self.tasks_grid_layout.removeWidget(self.task_buttons[task_id])
+            columns = 3
+            for index, task_id in enumerate(task_ids):
+                row, col = divmod(index, columns)
+                self.tasks_grid_layout.addWidget(self.task_buttons[task_id], row, col)
+        finally:
+            self.tasks_grid_layout.setEnabled(True)
+        self._task_button_order = task_ids
+    
+    def _sorted_task_button_ids(self) -> List[int]:
+        """Get task button ids sorted by task name, matching get_all_tasks order."""
+        return sorted(self.task_buttons, key=lambda task_id: self.task_buttons[task_id].task_name)
     
     @staticmethod
     def is_dark_color(hex_color: str) -> bool:
@@ -420,80 +609,52 @@ class MainWindow(QMainWindow):
         Returns:
             True if color is dark
         """
-        from PyQt6.QtGui import QColor
-        color = QColor(hex_color)
-        luminance = (0.299 * color.red() + 0.587 * color.green() + 0.114 * color.blue()) / 255
-        return luminance < 0.5
+        return is_dark_color(hex_color)
     
-    def load_active_timers(self):
-        """Load active timers from database."""
-        sessions = self.db.get_active_sessions()
+    def load_active_timers(self, sessions: Optional[Sequence] = None):
+        """Load active timers from database.
+        
+        Args:
+            sessions: Active session rows if already fetched; otherwise they
+                are read from the database
+        """
+        if sessions is None:
+            sessions = self.db.get_active_sessions()
         
         for session_row in sessions:
-            session = TimerSession.from_db_row(session_row)
+            # Only the ids and task name are needed, so read them off the row
+            session_id = session_row['id']
+            task_name = session_row['task_name']
+            self._track_session(session_id, session_row['start_time'])
             
             # Check if this is a special timer and set the session ID
-            if session.task_name == "Work Day":
-                self.work_day_session_id = session.id
+            if task_name == "Work Day":
+                self.work_day_session_id = session_id
                 # Update Work Day button state
                 self.work_day_button.setText("Stop Working")
-                self.work_day_button.setStyleSheet("""
-                    QPushButton {
-                        background-color: #e74c3c;
-                        color: white;
-                        font-size: 12pt;
-                        font-weight: bold;
-                        border-radius: 8px;
-                        min-width: 200px;
-                        min-height: 50px;
-                    }
-                    QPushButton:hover {
-                        background-color: #c0392b;
-                    }
-                """)
+                self.work_day_button.setStyleSheet(WORK_DAY_RUNNING_QSS)
                 self.lunch_button.setEnabled(True)
                 self.break_button.setEnabled(True)
-            elif session.task_name == "Lunch":
-                self.lunch_session_id = session.id
+            elif task_name == "Lunch":
+                self.lunch_session_id = session_id
                 # Update Lunch button state
                 self.lunch_button.setText("End Lunch")
-                self.lunch_button.setStyleSheet("""
-                    QPushButton {
-                        background-color: #e67e22;
-                        color: white;
-                        font-size: 11pt;
-                        font-weight: bold;
-                        border-radius: 8px;
-                        min-width: 150px;
-                        min-height: 50px;
-                    }
-                    QPushButton:hover {
-                        background-color: #d35400;
-                    }
-                """)
+                self.lunch_button.setStyleSheet(PAUSE_RUNNING_QSS)
                 self.break_button.setEnabled(False)
-            elif session.task_name == "Break":
-                self.break_session_id = session.id
+            elif task_name == "Break":
+                self.break_session_id = session_id
                 # Update Break button state
                 self.break_button.setText("End Break")
-                self.break_button.setStyleSheet("""
-                    QPushButton {
-                        background-color: #e67e22;
-                        color: white;
-                        font-size: 11pt;
-                        font-weight: bold;
-                        border-radius: 8px;
-                        min-width: 150px;
-                        min-height: 50px;
-                    }
-                    QPushButton:hover {
-                        background-color: #d35400;
-                    }
-                """)
+                self.break_button.setStyleSheet(PAUSE_RUNNING_QSS)
                 self.lunch_button.setEnabled(False)
             else:
                 # Regular task timer - track it
-                self.task_sessions[session.task_id] = session.id
+                self.task_sessions[session_row['task_id']] = session_id
+    
+    @pyqtSlot(bool)
+    def _on_task_button_clicked(self, _checked: bool = False):
+        """Toggle the timer for whichever task button emitted the click."""
+        self.toggle_task_timer(self.sender().property("taskId"))
     
     def toggle_task_timer(self, task_id: int):
         """Toggle timer for a task (start if stopped, stop if running).
@@ -506,104 +667,87 @@ class MainWindow(QMainWindow):
             session_id = self.task_sessions[task_id]
             self.db.stop_session(session_id)
             del self.task_sessions[task_id]
+            self._untrack_sessions([session_id])
             
             # Update button text
             if task_id in self.task_buttons:
                 button = self.task_buttons[task_id]
                 button.setText(f"Start {button.task_name}")
         else:
-            # Timer is not running, start it
-            session_id = self.db.start_session(task_id)
+            # Timer is not running, start it and log the context switch from
+            # the first other running task, if any, in one transaction
+            from_task_id = next(iter(self.task_sessions), None)
+            session_id, start_time = self.db.start_task_session(task_id, from_task_id)
             self.task_sessions[task_id] = session_id
-            
-            # Log context switch if other timers are active
-            active_task_ids = [tid for tid in self.task_sessions.keys() if tid != task_id]
-            if active_task_ids:
-                self.db.log_context_switch(active_task_ids[0], task_id)
-            else:
-                self.db.log_context_switch(None, task_id)
+            self._track_session(session_id, start_time)
+        
+        self.schedule_autosave()
+        self.schedule_reports_refresh()
+    
+    def _track_session(self, session_id: int, start_time: Optional[str] = None):
+        """Remember a running session's start time for the per-second display.
+        
+        Args:
+            session_id: Session ID
+            start_time: ISO start time if already known; otherwise it is read
+                from the database once
+        """
+        if start_time is None:
+            session_row = self.db.get_session_by_id(session_id)
+            if session_row is None:
+                return
+            start_time = session_row['start_time']
+        self._session_starts[session_id] = datetime.fromisoformat(start_time)
+        self._sync_display_timer()
+    
+    def _untrack_sessions(self, session_ids: Sequence[Optional[int]]):
+        """Forget stopped sessions, idling the display tick once none remain.
         
-        # Refresh reports
-        self.update_reports()
+        Args:
+            session_ids: Session IDs that are no longer running
+        """
+        for session_id in session_ids:
+            self._session_starts.pop(session_id, None)
+        self._sync_display_timer()
+    
+    def _elapsed_display(self, session_id: int, now: datetime) -> Optional[str]:
+        """Get HH:MM:SS elapsed for a tracked running session, or None if untracked."""
+        start_time = self._session_starts.get(session_id)
+        if start_time is None:
+            return None
+        return format_duration(int((now - start_time).total_seconds()))
     
     def update_task_button_displays(self):
         """Update the display of all task buttons showing elapsed time for running timers."""
-        # Update regular task buttons
-        for task_id, button in self.task_buttons.items():
-            if task_id in self.task_sessions:
-                # Task is running - show elapsed time
-                session_id = self.task_sessions[task_id]
-                session_row = self.db.get_session_by_id(session_id)
-                if session_row:
-                    session = TimerSession.from_db_row(session_row)
-                    elapsed = session.get_elapsed_display()
+        # Only labels change per tick; stylesheets are set on start/stop.
+        # Elapsed time is computed from cached start times; no database access
+        now = datetime.now(timezone.utc)
+        
+        # Update regular task buttons (only visible on the Timers tab)
+        if self.tabs.currentWidget() is self.timers_tab:
+            for task_id, session_id in self.task_sessions.items():
+                button = self.task_buttons.get(task_id)
+                elapsed = self._elapsed_display(session_id, now)
+                if button is not None and elapsed is not None:
                     button.setText(f"Stop {button.task_name}\n{elapsed}")
         
         # Update Work Day button
         if self.work_day_session_id is not None:
-            session_row = self.db.get_session_by_id(self.work_day_session_id)
-            if session_row:
-                session = TimerSession.from_db_row(session_row)
-                elapsed = session.get_elapsed_display()
+            elapsed = self._elapsed_display(self.work_day_session_id, now)
+            if elapsed is not None:
                 self.work_day_button.setText(f"Stop Working\n{elapsed}")
-                self.work_day_button.setStyleSheet("""
-                    QPushButton {
-                        background-color: #e74c3c;
-                        color: white;
-                        font-size: 11pt;
-                        font-weight: bold;
-                        border-radius: 8px;
-                        min-width: 200px;
-                        min-height: 50px;
-                    }
-                    QPushButton:hover {
-                        background-color: #c0392b;
-                    }
-                """)
         
         # Update Lunch button
         if self.lunch_session_id is not None:
-            session_row = self.db.get_session_by_id(self.lunch_session_id)
-            if session_row:
-                session = TimerSession.from_db_row(session_row)
-                elapsed = session.get_elapsed_display()
+            elapsed = self._elapsed_display(self.lunch_session_id, now)
+            if elapsed is not None:
                 self.lunch_button.setText(f"End Lunch\n{elapsed}")
-                self.lunch_button.setStyleSheet("""
-                    QPushButton {
-                        background-color: #e67e22;
-                        color: white;
-                        font-size: 10pt;
-                        font-weight: bold;
-                        border-radius: 8px;
-                        min-width: 150px;
-                        min-height: 50px;
-                    }
-                    QPushButton:hover {
-                        background-color: #d35400;
-                    }
-                """)
         
         # Update Break button
         if self.break_session_id is not None:
-            session_row = self.db.get_session_by_id(self.break_session_id)
-            if session_row:
-                session = TimerSession.from_db_row(session_row)
-                elapsed = session.get_elapsed_display()
+            elapsed = self._elapsed_display(self.break_session_id, now)
+            if elapsed is not None:
                 self.break_button.setText(f"End Break\n{elapsed}")
-                self.break_button.setStyleSheet("""
-                    QPushButton {
-                        background-color: #e67e22;
-                        color: white;
-                        font-size: 10pt;
-                        font-weight: bold;
-                        border-radius: 8px;
-                        min-width: 150px;
-                        min-height: 50px;
-                    }
-                    QPushButton:hover {
-                        background-color: #d35400;
-                    }
-                """)
     
     def add_task(self):
         """Show dialog to add new task."""
@@ -611,8 +755,12 @@ class MainWindow(QMainWindow):
         if dialog.exec():
             name, color = dialog.get_task_data()
             try:
-                self.db.create_task(name, color)
-                self.load_tasks()
+                task_id = self.db.create_task(name, color)
+                task = Task.from_db_row(self.db.get_task_by_id(task_id))
+                if task.name not in SPECIAL_TIMER_NAMES:
+                    self._create_task_button(task)
+                    self._layout_task_buttons(self._sorted_task_button_ids())
+                self.schedule_reports_refresh()
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to create task: {str(e)}")
     
@@ -630,7 +778,11 @@ class MainWindow(QMainWindow):
             name, color = dialog.get_task_data()
             try:
                 self.db.update_task(self.selected_task_id, name, color)
-                self.load_tasks()
+                task = Task.from_db_row(self.db.get_task_by_id(self.selected_task_id))
+                if task.id in self.task_buttons:
+                    self._update_task_button(task)
+                    self._layout_task_buttons(self._sorted_task_button_ids())
+                self.schedule_reports_refresh()
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to update task: {str(e)}")
     
@@ -652,8 +804,10 @@ class MainWindow(QMainWindow):
         
         if reply == QMessageBox.StandardButton.Yes:
             self.db.delete_task(self.selected_task_id)
+            if self.selected_task_id in self.task_buttons:
+                self._remove_task_button(self.selected_task_id)
+                self._layout_task_buttons(self._sorted_task_button_ids())
             self.selected_task_id = None
-            self.load_tasks()
     
     def stop_all_timers(self):
         """Stop all running timers."""
@@ -668,165 +822,250 @@ class MainWindow(QMainWindow):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            # Stop all regular task timers
-            task_ids = list(self.task_sessions.keys())
-            for task_id in task_ids:
-                self.toggle_task_timer(task_id)
+            self.stop_task_timers()
+    
+    def stop_task_timers(self, extra_session_ids: Sequence[int] = ()):
+        """Stop every running regular task timer in one database transaction.
+        
+        Args:
+            extra_session_ids: Other sessions (e.g. Work Day) to close in the
+                same transaction
+        """
+        session_ids = [*self.task_sessions.values(), *extra_session_ids]
+        if not session_ids:
+            return
+        
+        self.db.stop_sessions(session_ids)
+        self._untrack_sessions(session_ids)
+        
+        # Reset all button labels with one repaint instead of one per button
+        self.tasks_widget.setUpdatesEnabled(False)
+        try:
+            for task_id in self.task_sessions:
+                if task_id in self.task_buttons:
+                    button = self.task_buttons[task_id]
+                    button.setText(f"Start {button.task_name}")
+        finally:
+            self.tasks_widget.setUpdatesEnabled(True)
+        self.task_sessions.clear()
+        
+        self.schedule_autosave()
+        self.schedule_reports_refresh()
+    
+    def refresh_visible_reports(self):
+        """Update only the report on the current tab.
+        
+        Hidden reports are brought up to date when their tab is shown.
+        """
+        current = self.tabs.currentWidget()
+        if current is self.daily_tab:
+            self.update_daily_report()
+        elif current is self.weekly_tab:
+            self.update_weekly_report()
+    
+    def has_running_timers(self) -> bool:
+        """Check whether any task or Work Day/Lunch/Break timer is running."""
+        return bool(
+            self.task_sessions
+            or self.work_day_session_id is not None
+            or self.lunch_session_id is not None
+            or self.break_session_id is not None
+        )
     
-    def update_reports(self):
-        """Update daily and weekly reports."""
-        self.update_daily_report()
-        self.update_weekly_report()
+    def _report_cache_key(self, start_date: str, end_date: str):
+        """Build the cache key for a report over a date range.
+        
+        Args:
+            start_date: Start date (ISO format)
+            end_date: End date (ISO format)
+            
+        Returns:
+            Hashable key, or None if the report must be recomputed because
+            running timers make its totals change between refreshes
+        """
+        if self.has_running_timers():
+            return None
+        return (start_date, end_date, self.db.get_change_count())
     
     def update_daily_report(self):
         """Update daily report display."""
         start_date, end_date = get_date_range_for_today()
-        sessions = self.db.get_sessions_for_date_range(start_date, end_date)
-        switches = self.db.get_context_switches_for_date_range(start_date, end_date)
+        cache_key = self._report_cache_key(start_date, end_date)
+        if cache_key is not None and self._daily_cache.get('key') == cache_key:
+            return  # Nothing changed since the last render
         
-        # Calculate statistics
-        total_seconds = 0
-        task_times: Dict[int, Dict] = {}
+        task_totals, switch_count = self.get_day_totals(start_date, end_date)
+        total_seconds = sum(row['total_seconds'] for row in task_totals)
         
-        for session_row in sessions:
-            session = TimerSession.from_db_row(session_row)
-            duration = session.get_elapsed_seconds()
-            total_seconds += duration
+        # Generate report text
+        report = []
+        append = report.append
+        fmt_duration = format_duration
+        append(DAILY_RULE)
+        append(f"DAILY REPORT - {format_date(datetime.now(timezone.utc))}")
+        append(DAILY_RULE)
+        append("")
+        append("SUMMARY")
+        append(DAILY_SEPARATOR)
+        append(f"Total Tasks Worked On:     {len(task_totals)}")
+        append(f"Total Context Switches:    {switch_count}")
+        append(f"Total Time Worked:         {fmt_duration(total_seconds)}")
+        append("")
+        
+        if task_totals:
+            append("TASK BREAKDOWN")
+            append(DAILY_SEPARATOR)
+            append(DAILY_COLUMNS)
+            append(DAILY_SEPARATOR)
             
-            if session.task_id not in task_times:
-                task_times[session.task_id] = {
-                    'name': session.task_name,
-                    'duration': 0,
-                    'sessions': 0
-                }
+            for task_data in task_totals:
+                append(DAILY_ROW(
+                    task_data['task_name'],
+                    fmt_duration(task_data['total_seconds']),
+                    task_data['session_count']
+                ))
+        
+        text = "\n".join(report)
+        # Skip the relayout when the rendered text is unchanged
+        if text != self._daily_cache.get('text'):
+            self.daily_report_text.setPlainText(text)
+        self._daily_cache = {
+            'key': cache_key, 'text': text,
+            'totals': (task_totals, switch_count)
+        }
+    
+    def get_day_totals(self, start_date: str, end_date: str) -> Tuple[List, int]:
+        """Get per-task totals and the context switch count for a day.
+        
+        Reuses the rendered daily report's data while nothing has changed.
+        
+        Args:
+            start_date: Start of day (ISO format)
+            end_date: End of day (ISO format)
             
-            task_times[session.task_id]['duration'] += duration
-            task_times[session.task_id]['sessions'] += 1
+        Returns:
+            Tuple of (per-task total rows, longest first; context switch count)
+        """
+        cache_key = self._report_cache_key(start_date, end_date)
+        if cache_key is not None and self._daily_cache.get('key') == cache_key:
+            return self._daily_cache['totals']
+        
+        # Per-task totals are aggregated in SQL
+        return (
+            self.db.get_task_totals_for_date_range(start_date, end_date),
+            self.db.count_context_switches_for_date_range(start_date, end_date)
+        )
+    
+    def get_week_day_totals(self, week_dates: List[datetime]) -> List[Tuple[str, int, int, int]]:
+        """Get per-day totals for a week from one grouped query.
         
-        # Generate report text
-        report = []
-        report.append("=" * 60)
-        report.append(f"DAILY REPORT - {format_date(datetime.now(timezone.utc))}")
-        report.append("=" * 60)
-        report.append("")
-        report.append("SUMMARY")
-        report.append("-" * 60)
-        report.append(f"Total Tasks Worked On:     {len(task_times)}")
-        report.append(f"Total Context Switches:    {len(switches)}")
-        report.append(f"Total Time Worked:         {format_duration(total_seconds)}")
-        report.append("")
-        
-        if task_times:
-            report.append("TASK BREAKDOWN")
-            report.append("-" * 60)
-            report.append(f"{'Task':<30} {'Time':<12} {'Sessions':<10}")
-            report.append("-" * 60)
+        Args:
+            week_dates: Midnight UTC datetimes for each day of the week
             
-            for task_data in sorted(task_times.values(), key=lambda x: x['duration'], reverse=True):
-                report.append(
-                    f"{task_data['name']:<30} "
-                    f"{format_duration(task_data['duration']):<12} "
-                    f"{task_data['sessions']:<10}"
-                )
+        Returns:
+            List of (date label, total seconds, context switches, task count)
+            tuples, one per day, with zeros for days without activity
+        """
+        week_start = week_dates[0].isoformat()
+        week_end = (week_dates[-1] + timedelta(days=1)).isoformat()
+        # Reuse the rendered weekly report's data while nothing has changed
+        cache_key = self._report_cache_key(week_start, week_end)
+        if cache_key is not None and self._weekly_cache.get('key') == cache_key:
+            return self._weekly_cache['totals']
+        
+        daily_totals = {
+            row['day']: row
+            for row in self.db.get_daily_totals_for_date_range(week_start, week_end)
+        }
         
-        self.daily_report_text.setText("\n".join(report))
+        day_totals = []
+        for date in week_dates:
+            totals = daily_totals.get(date.strftime("%Y-%m-%d"))
+            if totals:
+                day_totals.append((
+                    format_date(date), totals['total_seconds'],
+                    totals['switch_count'], totals['task_count']
+                ))
+            else:
+                day_totals.append((format_date(date), 0, 0, 0))
+        return day_totals
     
     def update_weekly_report(self):
         """Update weekly report display."""
         week_dates = get_week_dates()
+        week_start = week_dates[0].isoformat()
+        week_end = (week_dates[-1] + timedelta(days=1)).isoformat()
+        cache_key = self._report_cache_key(week_start, week_end)
+        if cache_key is not None and self._weekly_cache.get('key') == cache_key:
+            return  # Nothing changed since the last render
         
         report = []
-        report.append("=" * 80)
-        report.append(f"WEEKLY REPORT - Week of {format_date(week_dates[0])}")
-        report.append("=" * 80)
-        report.append("")
+        append = report.append
+        fmt_duration = format_duration
+        append(WEEKLY_RULE)
+        append(f"WEEKLY REPORT - Week of {format_date(week_dates[0])}")
+        append(WEEKLY_RULE)
+        append("")
         
         total_week_seconds = 0
         total_week_switches = 0
         
-        report.append(f"{'Date':<15} {'Total Time':<15} {'Context Switches':<20} {'Tasks':<10}")
-        report.append("-" * 80)
+        append(WEEKLY_COLUMNS)
+        append(WEEKLY_SEPARATOR)
         
-        for date in week_dates:
-            start = date.isoformat()
-            end = (date + timedelta(days=1)).isoformat()
-            
-            sessions = self.db.get_sessions_for_date_range(start, end)
-            switches = self.db.get_context_switches_for_date_range(start, end)
-            
-            day_seconds = 0
-            task_ids = set()
-            
-            for session_row in sessions:
-                session = TimerSession.from_db_row(session_row)
-                day_seconds += session.get_elapsed_seconds()
-                task_ids.add(session.task_id)
-            
+        day_totals = self.get_week_day_totals(week_dates)
+        for day_label, day_seconds, day_switches, day_tasks in day_totals:
             total_week_seconds += day_seconds
-            total_week_switches += len(switches)
+            total_week_switches += day_switches
             
-            report.append(
-                f"{format_date(date):<15} "
-                f"{format_duration(day_seconds):<15} "
-                f"{len(switches):<20} "
-                f"{len(task_ids):<10}"
-            )
-        
-        report.append("-" * 80)
-        report.append("")
-        report.append("WEEKLY SUMMARY")
-        report.append("-" * 80)
-        report.append(f"Total Time Worked:         {format_duration(total_week_seconds)}")
-        report.append(f"Total Context Switches:    {total_week_switches}")
-        report.append(f"Average Daily Time:        {format_duration(total_week_seconds // 7)}")
-        
-        self.weekly_report_text.setText("\n".join(report))
+            append(WEEKLY_ROW(day_label, fmt_duration(day_seconds), day_switches, day_tasks))
+        
+        append(WEEKLY_SEPARATOR)
+        append("")
+        append("WEEKLY SUMMARY")
+        append(WEEKLY_SEPARATOR)
+        append(f"Total Time Worked:         {fmt_duration(total_week_seconds)}")
+        append(f"Total Context Switches:    {total_week_switches}")
+        append(f"Average Daily Time:        {fmt_duration(total_week_seconds // 7)}")
+        
+        text = "\n".join(report)
+        # Skip the relayout when the rendered text is unchanged
+        if text != self._weekly_cache.get('text'):
+            self.weekly_report_text.setPlainText(text)
+        self._weekly_cache = {'key': cache_key, 'text': text, 'totals': day_totals}
     
     def export_daily_report(self):
         """Export daily report to CSV."""
+        # One clock read so the filename, date range and report date agree
+        now = datetime.now(timezone.utc)
         export_dir = get_default_export_path()
-        filename = generate_export_filename("daily", datetime.now(timezone.utc).strftime("%Y%m%d"))
+        filename = generate_export_filename("daily", now.strftime("%Y%m%d"), now)
         filepath = export_dir / filename
         
         # Prepare report data
-        start_date, end_date = get_date_range_for_today()
-        sessions = self.db.get_sessions_for_date_range(start_date, end_date)
-        switches = self.db.get_context_switches_for_date_range(start_date, end_date)
+        start_date, end_date = get_date_range_for_today(now)
+        task_totals, switch_count = self.get_day_totals(start_date, end_date)
         
-        task_times: Dict[int, Dict] = {}
-        total_seconds = 0
-        
-        for session_row in sessions:
-            session = TimerSession.from_db_row(session_row)
-            duration = session.get_elapsed_seconds()
-            total_seconds += duration
-            
-            if session.task_id not in task_times:
-                task_times[session.task_id] = {
-                    'name': session.task_name,
-                    'duration': 0,
-                    'sessions': 0
-                }
-            
-            task_times[session.task_id]['duration'] += duration
-            task_times[session.task_id]['sessions'] += 1
+        # The export lists tasks in the order they were first worked on
+        task_totals = sorted(task_totals, key=lambda row: row['first_start_time'])
+        total_seconds = sum(row['total_seconds'] for row in task_totals)
         
         report_data = {
-            'date': format_date(datetime.now(timezone.utc)),
-            'total_tasks': len(task_times),
-            'total_switches': len(switches),
+            'date': format_date(now),
+            'total_tasks': len(task_totals),
+            'total_switches': switch_count,
             'total_time_formatted': format_duration(total_seconds),
             'tasks': [
                 {
-                    'name': data['name'],
-                    'duration_formatted': format_duration(data['duration']),
-                    'session_count': data['sessions']
+                    'name': row['task_name'],
+                    'duration_formatted': format_duration(row['total_seconds']),
+                    'session_count': row['session_count']
                 }
-                for data in task_times.values()
+                for row in task_totals
             ]
         }
         
-        export_daily_report_to_csv(report_data, str(filepath))
+        export_daily_report_to_csv(report_data, filepath)
         QMessageBox.information(
             self, "Export Complete",
             f"Daily report exported to:\n{filepath}"
@@ -835,50 +1074,36 @@ class MainWindow(QMainWindow):
     def export_weekly_report(self):
         """Export weekly report to CSV."""
         export_dir = get_default_export_path()
-        week_start = get_week_dates()[0]
-        filename = generate_export_filename("weekly", week_start.strftime("%Y%m%d"))
+        week_dates = get_week_dates()
+        filename = generate_export_filename("weekly", week_dates[0].strftime("%Y%m%d"))
         filepath = export_dir / filename
         
-        week_dates = get_week_dates()
         days_data = []
         total_week_seconds = 0
         total_week_switches = 0
         
-        for date in week_dates:
-            start = date.isoformat()
-            end = (date + timedelta(days=1)).isoformat()
-            
-            sessions = self.db.get_sessions_for_date_range(start, end)
-            switches = self.db.get_context_switches_for_date_range(start, end)
-            
-            day_seconds = 0
-            task_ids = set()
-            
-            for session_row in sessions:
-                session = TimerSession.from_db_row(session_row)
-                day_seconds += session.get_elapsed_seconds()
-                task_ids.add(session.task_id)
-            
+        day_totals = self.get_week_day_totals(week_dates)
+        for day_label, day_seconds, day_switches, day_tasks in day_totals:
             total_week_seconds += day_seconds
-            total_week_switches += len(switches)
+            total_week_switches += day_switches
             
             days_data.append({
-                'date': format_date(date),
+                'date': day_label,
                 'total_time_formatted': format_duration(day_seconds),
-                'context_switches': len(switches),
-                'task_count': len(task_ids)
+                'context_switches': day_switches,
+                'task_count': day_tasks
             })
         
         report_data = {
-            'week_start': format_date(week_dates[0]),
-            'week_end': format_date(week_dates[-1]),
+            'week_start': day_totals[0][0],
+            'week_end': day_totals[-1][0],
             'days': days_data,
             'total_time_formatted': format_duration(total_week_seconds),
             'total_switches': total_week_switches,
             'average_daily_time': format_duration(total_week_seconds // 7)
         }
         
-        export_weekly_report_to_csv(report_data, str(filepath))
+        export_weekly_report_to_csv(report_data, filepath)
         QMessageBox.information(
             self, "Export Complete",
             f"Weekly report exported to:\n{filepath}"
@@ -886,8 +1111,6 @@ class MainWindow(QMainWindow):
     
     def export_data(self):
         """Export all timer session data to CSV."""
-        from PyQt6.QtWidgets import QDialog, QVBoxLayout, QLabel, QComboBox, QPushButton, QDialogButtonBox
-        
         # Create dialog to choose date range
         dialog = QDialog(self)
         dialog.setWindowTitle("Export Timer Data")
@@ -911,20 +1134,22 @@ class MainWindow(QMainWindow):
         if dialog.exec():
             period = period_combo.currentText()
             
-            # Determine date range
+            # Determine date range from a single clock read
+            now = datetime.now(timezone.utc)
             if period == "Today":
-                start_date, end_date = get_date_range_for_today()
-                date_suffix = datetime.now(timezone.utc).strftime("%Y%m%d")
+                start_date, end_date = get_date_range_for_today(now)
+                date_suffix = now.strftime("%Y%m%d")
             elif period == "This Week":
-                start_date, end_date = get_date_range_for_week()
-                date_suffix = get_week_dates()[0].strftime("%Y%m%d") + "-week"
+                start_date, end_date = get_date_range_for_week(now)
+                # "YYYY-MM-DD..." of the week's Monday -> "YYYYMMDD"
+                date_suffix = start_date[:10].replace('-', '') + "-week"
             elif period == "This Month":
-                start_date, end_date = get_date_range_for_month()
-                date_suffix = datetime.now(timezone.utc).strftime("%Y%m")
+                start_date, end_date = get_date_range_for_month(now)
+                date_suffix = now.strftime("%Y%m")
             else:  # All Time
-                # Get earliest session
-                start_date = "2000-01-01T00:00:00+00:00"
-                end_date = datetime.now(timezone.utc).isoformat()
+                # Start at the earliest session so the range seek is tight
+                end_date = now.isoformat()
+                start_date = self.db.get_earliest_session_time() or end_date
                 date_suffix = "all-time"
             
             self.export_sessions_csv(start_date, end_date, date_suffix)
@@ -932,6 +1157,9 @@ class MainWindow(QMainWindow):
     def export_sessions_csv(self, start_date: str, end_date: str, date_suffix: str):
         """Export timer sessions to CSV.
         
+        The file is written on a background thread so large exports don't
+        block the UI; a message is shown once it has been written.
+        
         Args:
             start_date: Start date ISO format
             end_date: End date ISO format
@@ -941,34 +1169,27 @@ class MainWindow(QMainWindow):
         filename = generate_export_filename("sessions", date_suffix)
         filepath = export_dir / filename
         
-        # Get all sessions in date range
-        sessions = self.db.get_sessions_for_date_range(start_date, end_date)
-        
-        # Prepare session data for export
-        session_data = []
-        for session_row in sessions:
-            session = TimerSession.from_db_row(session_row)
-            
-            # Format timestamps as YYYY-MM-DD HH:MM:SS (standard datetime format with seconds)
-            start_time_str = session.start_time.strftime("%Y-%m-%d %H:%M:%S") if session.start_time else ''
-            end_time_str = session.end_time.strftime("%Y-%m-%d %H:%M:%S") if session.end_time else 'Running'
-            
-            session_data.append({
-                'task_name': session.task_name or 'Unknown',
-                'start_time': start_time_str,
-                'end_time': end_time_str,
-                'duration_seconds': session.duration_seconds or session.get_elapsed_seconds(),
-                'duration_formatted': session.get_elapsed_display()
-            })
-        
-        # Export to CSV
-        export_sessions_to_csv(session_data, str(filepath))
-        
+        worker = SessionExportWorker(self.db.db_path, start_date, end_date, filepath)
+        worker.signals.finished.connect(self._on_sessions_exported)
+        worker.signals.failed.connect(self._on_sessions_export_failed)
+        self._export_workers[worker.signals] = worker
+        QThreadPool.globalInstance().start(worker)
+    
+    @pyqtSlot(str, int)
+    def _on_sessions_exported(self, filepath: str, count: int):
+        """Report a finished background session export."""
+        self._export_workers.pop(self.sender(), None)
         QMessageBox.information(
             self, "Export Complete",
-            f"Exported {len(session_data)} timer sessions to:\n{filepath}"
+            f"Exported {count} timer sessions to:\n{filepath}"
         )
     
+    @pyqtSlot(str)
+    def _on_sessions_export_failed(self, error: str):
+        """Report a failed background session export."""
+        self._export_workers.pop(self.sender(), None)
+        QMessageBox.critical(self, "Error", f"Failed to export sessions: {error}")
+    
     def clear_today_history(self):
         """Clear all history for today."""
         reply = QMessageBox.question(
@@ -987,7 +1208,7 @@ class MainWindow(QMainWindow):
             self.stop_all_timers()
             
             # Refresh reports
-            self.update_reports()
+            self.schedule_reports_refresh()
             
             QMessageBox.information(
                 self, "History Cleared",
@@ -1012,7 +1233,7 @@ class MainWindow(QMainWindow):
             self.stop_all_timers()
             
             # Refresh reports
-            self.update_reports()
+            self.schedule_reports_refresh()
             
             QMessageBox.information(
                 self, "History Cleared",
@@ -1050,13 +1271,24 @@ class MainWindow(QMainWindow):
                 self.stop_all_timers()
                 
                 # Refresh reports
-                self.update_reports()
+                self.schedule_reports_refresh()
                 
                 QMessageBox.information(
                     self, "History Cleared",
                     f"Deleted all {count} timer sessions."
                 )
     
+    def schedule_autosave(self):
+        """Request an autosave; repeated calls restart the quiet period."""
+        if AUTOSAVE_ENABLED:
+            self.autosave_timer.start()
+    
+    def schedule_reports_refresh(self):
+        """Request a report refresh; calls in quick succession coalesce into one."""
+        self.report_refresh_timer.start()
+        # Timers may have started or stopped
+        self._sync_report_timer()
+    
     def autosave(self):
         """Auto-save timer state."""
         # Database saves on each operation, so this is a placeholder
@@ -1078,14 +1310,20 @@ class MainWindow(QMainWindow):
         dialog = PreferencesDialog(self, self.db)
         dialog.exec()
     
-    def check_auto_start_work_day(self):
-        """Check if Work Day should auto-start based on preferences."""
+    def check_auto_start_work_day(self, start_time_str: Optional[str] = None):
+        """Check if Work Day should auto-start based on preferences.
+        
+        Args:
+            start_time_str: Expected start time (HH:MM) if already fetched;
+                otherwise it is read from the database
+        """
         # Don't auto-start if Work Day is already running
         if self.work_day_session_id is not None:
             return
         
         # Get expected start time from preferences
-        start_time_str = self.db.get_setting('expected_start_time')
+        if start_time_str is None:
+            start_time_str = self.db.get_setting('expected_start_time')
         if not start_time_str:
             return  # No preference set
         
@@ -1103,193 +1341,176 @@ class MainWindow(QMainWindow):
         if now >= expected_start:
             self.toggle_work_day()
     
+    def _get_or_create_special_task(self, name: str, color: str) -> int:
+        """Get the id of a Work Day/Lunch/Break task, creating it on first use.
+        
+        Ids are cached on the window since these tasks are never removed.
+        
+        Args:
+            name: Special task name
+            color: Color to create the task with if it doesn't exist
+            
+        Returns:
+            Task ID
+        """
+        task_id = self._special_task_ids.get(name)
+        if task_id is None:
+            task_id = self.db.upsert_special_task(name, color)
+            self._special_task_ids[name] = task_id
+        return task_id
+    
     def toggle_work_day(self):
         """Toggle Work Day timer."""
         if self.work_day_session_id is None:
             # Start Work Day timer
             # Create or get Work Day task
-            tasks = self.db.get_all_tasks()
-            work_day_task = next((t for t in tasks if t['name'] == "Work Day"), None)
-            
-            if work_day_task is None:
-                # Create Work Day task
-                work_day_task_id = self.db.create_task("Work Day", "#2ecc71")  # Green
-            else:
-                work_day_task_id = work_day_task['id']
+            work_day_task_id = self._get_or_create_special_task("Work Day", "#2ecc71")  # Green
             
             # Get or create Work Day session for today (reuses existing if stopped earlier today)
             self.work_day_session_id = self.db.get_or_create_work_day_session_for_today(work_day_task_id)
+            self._track_session(self.work_day_session_id)
+            self.work_day_button.setStyleSheet(WORK_DAY_RUNNING_QSS)
             
             # Enable Lunch and Break buttons
             self.lunch_button.setEnabled(True)
             self.break_button.setEnabled(True)
         else:
-            # Stop Work Day timer
-            self.db.stop_session(self.work_day_session_id)
+            # Stop Work Day, any Lunch/Break and all regular task timers together
+            pause_session_ids = [
+                session_id for session_id in (self.lunch_session_id, self.break_session_id)
+                if session_id is not None
+            ]
+            self.stop_task_timers([self.work_day_session_id, *pause_session_ids])
             
             # Reset session ID
             self.work_day_session_id = None
             
             # Update button back to Start state
             self.work_day_button.setText("Start My Day")
-            self.work_day_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #27ae60;
-                    color: white;
-                    font-size: 12pt;
-                    font-weight: bold;
-                    border-radius: 8px;
-                    min-width: 200px;
-                    min-height: 50px;
-                }
-                QPushButton:hover {
-                    background-color: #229954;
-                }
-            """)
-            
-            # Stop all regular task timers
-            task_ids = list(self.task_sessions.keys())
-            for task_id in task_ids:
-                self.toggle_task_timer(task_id)
+            self.work_day_button.setStyleSheet(WORK_DAY_STOPPED_QSS)
             
             # Reset Lunch/Break session IDs and buttons
             self.lunch_session_id = None
             self.break_session_id = None
             
             self.lunch_button.setText("Lunch")
-            self.lunch_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #f39c12;
-                    color: white;
-                    font-size: 11pt;
-                    font-weight: bold;
-                    border-radius: 8px;
-                    min-width: 150px;
-                    min-height: 50px;
-                }
-                QPushButton:hover {
-                    background-color: #e67e22;
-                }
-            """)
+            self.lunch_button.setStyleSheet(PAUSE_STOPPED_QSS)
             
             self.break_button.setText("Break")
-            self.break_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #f39c12;
-                    color: white;
-                    font-size: 11pt;
-                    font-weight: bold;
-                    border-radius: 8px;
-                    min-width: 150px;
-                    min-height: 50px;
-                }
-                QPushButton:hover {
-                    background-color: #e67e22;
-                }
-            """)
+            self.break_button.setStyleSheet(PAUSE_STOPPED_QSS)
             
             self.lunch_button.setEnabled(False)
             self.break_button.setEnabled(False)
+        
+        self.schedule_autosave()
+        self.schedule_reports_refresh()
     
     def toggle_lunch(self):
         """Toggle Lunch timer."""
         if self.lunch_session_id is None:
             # Stop all regular task timers (but NOT Work Day)
-            task_ids = list(self.task_sessions.keys())
-            for task_id in task_ids:
-                self.toggle_task_timer(task_id)
+            self.stop_task_timers()
             
             # Create or get Lunch task
-            tasks = self.db.get_all_tasks()
-            lunch_task = next((t for t in tasks if t['name'] == "Lunch"), None)
-            
-            if lunch_task is None:
-                # Create Lunch task
-                lunch_task_id = self.db.create_task("Lunch", "#f39c12")  # Yellow
-            else:
-                lunch_task_id = lunch_task['id']
+            lunch_task_id = self._get_or_create_special_task("Lunch", "#f39c12")  # Yellow
             
             # Start timer
             self.lunch_session_id = self.db.start_session(lunch_task_id)
+            self._track_session(self.lunch_session_id)
+            self.lunch_button.setStyleSheet(PAUSE_RUNNING_QSS)
             
             # Disable Break button
             self.break_button.setEnabled(False)
         else:
             # Stop Lunch timer
             self.db.stop_session(self.lunch_session_id)
+            self._untrack_sessions([self.lunch_session_id])
             
             # Reset session ID
             self.lunch_session_id = None
             
             # Reset button
             self.lunch_button.setText("Lunch")
-            self.lunch_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #f39c12;
-                    color: white;
-                    font-size: 11pt;
-                    font-weight: bold;
-                    border-radius: 8px;
-                    min-width: 150px;
-                    min-height: 50px;
-                }
-                QPushButton:hover {
-                    background-color: #e67e22;
-                }
-            """)
+            self.lunch_button.setStyleSheet(PAUSE_STOPPED_QSS)
             
             # Re-enable Break button
             self.break_button.setEnabled(True)
+        
+        self.schedule_autosave()
+        self.schedule_reports_refresh()
     
     def toggle_break(self):
         """Toggle Break timer."""
         if self.break_session_id is None:
             # Stop all regular task timers (but NOT Work Day)
-            task_ids = list(self.task_sessions.keys())
-            for task_id in task_ids:
-                self.toggle_task_timer(task_id)
+            self.stop_task_timers()
             
             # Create or get Break task
-            tasks = self.db.get_all_tasks()
-            break_task = next((t for t in tasks if t['name'] == "Break"), None)
-            
-            if break_task is None:
-                # Create Break task
-                break_task_id = self.db.create_task("Break", "#f39c12")  # Yellow
-            else:
-                break_task_id = break_task['id']
+            break_task_id = self._get_or_create_special_task("Break", "#f39c12")  # Yellow
             
             # Start timer
             self.break_session_id = self.db.start_session(break_task_id)
+            self._track_session(self.break_session_id)
+            self.break_button.setStyleSheet(PAUSE_RUNNING_QSS)
             
             # Disable Lunch button
             self.lunch_button.setEnabled(False)
         else:
             # Stop Break timer
             self.db.stop_session(self.break_session_id)
+            self._untrack_sessions([self.break_session_id])
             
             # Reset session ID
             self.break_session_id = None
             
             # Reset button
             self.break_button.setText("Break")
-            self.break_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #f39c12;
-                    color: white;
-                    font-size: 11pt;
-                    font-weight: bold;
-                    border-radius: 8px;
-                    min-width: 150px;
-                    min-height: 50px;
-                }
-                QPushButton:hover {
-                    background-color: #e67e22;
-                }
-            """)
+            self.break_button.setStyleSheet(PAUSE_STOPPED_QSS)
             
             # Re-enable Lunch button
             self.lunch_button.setEnabled(True)
+        
+        self.schedule_autosave()
+        self.schedule_reports_refresh()
+    
+    def showEvent(self, event):
+        """Start the display and report ticks when the window is shown."""
+        super().showEvent(event)
+        self._sync_display_timer()
+        self._sync_report_timer()
+    
+    def hideEvent(self, event):
+        """Stop the display and report ticks while the window is hidden."""
+        super().hideEvent(event)
+        self._sync_display_timer()
+        self._sync_report_timer()
+    
+    def changeEvent(self, event):
+        """Pause the display and report ticks while the window is minimized."""
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange:
+            self._sync_display_timer()
+            self._sync_report_timer()
+    
+    def _sync_display_timer(self):
+        """Run the per-second display tick only while a timer runs in a visible window."""
+        if self._session_starts and self.isVisible() and not self.isMinimized():
+            if not self.display_timer.isActive():
+                # Catch up immediately rather than waiting a full tick
+                self.update_task_button_displays()
+                self.display_timer.start()
+        else:
+            self.display_timer.stop()
+    
+    def _sync_report_timer(self):
+        """Run the report tick only while a report tab shows running totals."""
+        if (self.tabs.currentWidget() in (self.daily_tab, self.weekly_tab)
+                and self.isVisible() and not self.isMinimized()
+                and self.has_running_timers()):
+            if not self.report_timer.isActive():
+                self.report_timer.start()
+        else:
+            self.report_timer.stop()
     
     def closeEvent(self, event):
         """Handle window close event.
@@ -1308,5 +1529,7 @@ class MainWindow(QMainWindow):
                 event.ignore()
                 return
         
+        # Give any background export a bounded chance to finish its file
+        QThreadPool.globalInstance().waitForDone(EXPORT_SHUTDOWN_TIMEOUT_MS)
         self.db.close()
         event.accept()
@@ -6,6 +6,8 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QColor
 
+from .colors import is_dark_color
+
 
 class TaskDialog(QDialog):
     """Dialog for creating or editing tasks."""
@@ -89,10 +91,7 @@ class TaskDialog(QDialog):
         Returns:
             True if color is dark
         """
-        color = QColor(hex_color)
-        # Calculate luminance
-        luminance = (0.299 * color.red() + 0.587 * color.green() + 0.114 * color.blue()) / 255
-        return luminance < 0.5
+        return is_dark_color(hex_color)
     
     def accept(self):
         """Validate and accept dialog."""
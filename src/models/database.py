@@ -3,17 +3,32 @@ import sqlite3
 import os
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import Iterator, Optional, List, Tuple
+
+# Elapsed whole seconds for a session row: the stored duration once stopped,
+# otherwise the time from start_time up to the :now parameter. julianday() is
+# millisecond-precise, so round to ms before truncating to avoid whole-second
+# spans coming out one second short.
+_ELAPSED_SECONDS_SQL = """COALESCE(
+    duration_seconds,
+    CAST(ROUND((julianday(:now) - julianday(start_time)) * 86400000) AS INTEGER) / 1000
+)"""
+
+# Whole seconds from start_time up to the end time bound to the placeholder,
+# rounded the same way as above.
+_DURATION_SECONDS_SQL = "CAST(ROUND((julianday(?) - julianday(start_time)) * 86400000) AS INTEGER) / 1000"
 
 
 class Database:
     """Manages SQLite database connections and operations."""
     
-    def __init__(self, db_path: Optional[str] = None):
+    def __init__(self, db_path: Optional[str] = None, read_only: bool = False):
         """Initialize database connection.
         
         Args:
             db_path: Path to SQLite database file. If None, uses default location.
+            read_only: Open an existing database file read-only, without
+                creating or migrating the schema
         """
         if db_path is None:
             # Use XDG standard location on Linux
@@ -22,14 +37,34 @@ class Database:
             db_path = str(data_dir / "timers.db")
         
         self.db_path = db_path
+        self.read_only = read_only
         self.connection: Optional[sqlite3.Connection] = None
-        self._initialize_database()
+        if read_only:
+            if db_path == ":memory:":
+                raise ValueError("An in-memory database can't be opened read-only")
+        else:
+            self._initialize_database()
     
     def _get_connection(self) -> sqlite3.Connection:
         """Get or create database connection."""
         if self.connection is None:
-            self.connection = sqlite3.connect(self.db_path)
+            if self.read_only:
+                uri = Path(self.db_path).resolve().as_uri() + "?mode=ro"
+                self.connection = sqlite3.connect(uri, uri=True)
+            else:
+                self.connection = sqlite3.connect(self.db_path)
             self.connection.row_factory = sqlite3.Row
+            if not self.read_only:
+                # WAL keeps commits cheap (no full fsync per write on the GUI
+                # thread) and lets readers proceed while a write is in flight
+                self.connection.execute("PRAGMA journal_mode=WAL")
+                self.connection.execute("PRAGMA synchronous=NORMAL")
+            # Keep temp b-trees (GROUP BY/ORDER BY in reports) and ~20MB of
+            # pages in memory
+            self.connection.execute("PRAGMA temp_store=MEMORY")
+            self.connection.execute("PRAGMA cache_size=-20000")
+            # Read pages through a memory map (up to 256MB) instead of read()
+            self.connection.execute("PRAGMA mmap_size=268435456")
         return self.connection
     
     def _initialize_database(self):
@@ -86,9 +121,12 @@ class Database:
             ON timer_sessions(task_id, start_time)
         """)
         
+        # Covering index for the date-range report, export and session
+        # queries; it also serves every lookup the old start_time-only index did
+        cursor.execute("DROP INDEX IF EXISTS idx_sessions_start_time")
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_sessions_start_time 
-            ON timer_sessions(start_time)
+            CREATE INDEX IF NOT EXISTS idx_sessions_range 
+            ON timer_sessions(start_time, task_id, end_time, duration_seconds)
         """)
         
         cursor.execute("""
@@ -112,6 +150,17 @@ class Database:
         """Context manager exit."""
         self.close()
     
+    def get_change_count(self) -> int:
+        """Get the number of rows modified through this connection.
+        
+        Cheap version stamp for caching query results: it only changes
+        when a write goes through this database.
+        
+        Returns:
+            Total rows inserted, updated or deleted since the connection opened
+        """
+        return self._get_connection().total_changes
+    
     # Task operations
     def create_task(self, name: str, color: Optional[str] = None) -> int:
         """Create a new task.
@@ -134,6 +183,30 @@ class Database:
         conn.commit()
         return cursor.lastrowid
     
+    def upsert_special_task(self, name: str, color: Optional[str] = None) -> int:
+        """Get the id of a task by name, creating it if it doesn't exist.
+        
+        Args:
+            name: Task name
+            color: Color code used only when the task is created
+            
+        Returns:
+            Task ID
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        created_at = datetime.now(timezone.utc).isoformat()
+        
+        # DO NOTHING leaves an existing row untouched, so a lookup doesn't
+        # bump total_changes and invalidate the report caches
+        cursor.execute("""
+            INSERT INTO tasks (name, color, created_at) VALUES (?, ?, ?)
+            ON CONFLICT(name) DO NOTHING
+        """, (name, color, created_at))
+        conn.commit()
+        cursor.execute("SELECT id FROM tasks WHERE name = ?", (name,))
+        return cursor.fetchone()[0]
+    
     def get_all_tasks(self, active_only: bool = True) -> List[sqlite3.Row]:
         """Get all tasks.
         
@@ -218,6 +291,34 @@ class Database:
         conn.commit()
         return cursor.lastrowid
     
+    def start_task_session(self, task_id: int, from_task_id: Optional[int]) -> Tuple[int, str]:
+        """Start a task's timer session and log the context switch to it.
+        
+        Both rows are written in a single transaction with the same timestamp.
+        
+        Args:
+            task_id: Task ID to start
+            from_task_id: Previously running task ID (None if no other task)
+            
+        Returns:
+            Tuple of (session ID, ISO start time)
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        start_time = datetime.now(timezone.utc).isoformat()
+        
+        cursor.execute(
+            "INSERT INTO timer_sessions (task_id, start_time) VALUES (?, ?)",
+            (task_id, start_time)
+        )
+        session_id = cursor.lastrowid
+        cursor.execute(
+            "INSERT INTO context_switches (from_task_id, to_task_id, timestamp) VALUES (?, ?, ?)",
+            (from_task_id, task_id, start_time)
+        )
+        conn.commit()
+        return session_id, start_time
+    
     def stop_session(self, session_id: int):
         """Stop a timer session.
         
@@ -225,22 +326,36 @@ class Database:
             session_id: Session ID
         """
         conn = self._get_connection()
-        cursor = conn.cursor()
         end_time = datetime.now(timezone.utc).isoformat()
         
-        # Get start time to calculate duration
-        cursor.execute("SELECT start_time FROM timer_sessions WHERE id = ?", (session_id,))
-        row = cursor.fetchone()
-        if row:
-            start_time = datetime.fromisoformat(row['start_time'])
-            end_time_dt = datetime.fromisoformat(end_time)
-            duration_seconds = int((end_time_dt - start_time).total_seconds())
-            
-            cursor.execute(
-                "UPDATE timer_sessions SET end_time = ?, duration_seconds = ? WHERE id = ?",
-                (end_time, duration_seconds, session_id)
-            )
-            conn.commit()
+        conn.execute(
+            f"UPDATE timer_sessions SET end_time = ?, duration_seconds = {_DURATION_SECONDS_SQL} WHERE id = ?",
+            (end_time, end_time, session_id)
+        )
+        conn.commit()
+    
+    def stop_sessions(self, session_ids: List[int]):
+        """Stop several timer sessions in a single transaction.
+        
+        All sessions share the same end time.
+        
+        Args:
+            session_ids: Session IDs
+        """
+        if not session_ids:
+            return
+        
+        conn = self._get_connection()
+        end_time = datetime.now(timezone.utc).isoformat()
+        
+        placeholders = ",".join("?" * len(session_ids))
+        conn.execute(
+            f"""UPDATE timer_sessions
+                SET end_time = ?, duration_seconds = {_DURATION_SECONDS_SQL}
+                WHERE id IN ({placeholders})""",
+            [end_time, end_time, *session_ids]
+        )
+        conn.commit()
     
     def get_active_sessions(self) -> List[sqlite3.Row]:
         """Get all currently active (running) sessions.
@@ -259,6 +374,24 @@ class Database:
         """)
         return cursor.fetchall()
     
+    def get_startup_snapshot(self) -> Tuple[List[sqlite3.Row], List[sqlite3.Row], Optional[str]]:
+        """Get everything the main window needs at startup in one read transaction.
+        
+        Returns:
+            Tuple of (active task rows, active session rows, expected start
+            time setting or None)
+        """
+        conn = self._get_connection()
+        conn.execute("BEGIN")
+        try:
+            return (
+                self.get_all_tasks(),
+                self.get_active_sessions(),
+                self.get_setting('expected_start_time'),
+            )
+        finally:
+            conn.commit()
+    
     def get_session_by_id(self, session_id: int) -> Optional[sqlite3.Row]:
         """Get a session by its ID.
         
@@ -318,6 +451,17 @@ class Database:
             # Create new session
             return self.start_session(task_id)
     
+    def get_earliest_session_time(self) -> Optional[str]:
+        """Get the start time of the earliest session.
+        
+        Returns:
+            ISO start time, or None if there are no sessions
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT MIN(start_time) FROM timer_sessions")
+        return cursor.fetchone()[0]
+    
     def get_sessions_for_date_range(self, start_date: str, end_date: str) -> List[sqlite3.Row]:
         """Get sessions within a date range.
         
@@ -330,8 +474,10 @@ class Database:
         """
         conn = self._get_connection()
         cursor = conn.cursor()
+        # Explicit columns so the range scan is served by idx_sessions_range
         cursor.execute("""
-            SELECT s.*, t.name as task_name, t.color as task_color
+            SELECT s.id, s.task_id, s.start_time, s.end_time, s.duration_seconds,
+                   t.name as task_name, t.color as task_color
             FROM timer_sessions s
             JOIN tasks t ON s.task_id = t.id
             WHERE s.start_time >= ? AND s.start_time < ?
@@ -339,6 +485,112 @@ class Database:
         """, (start_date, end_date))
         return cursor.fetchall()
     
+    def iter_sessions_for_export(self, start_date: str, end_date: str) -> Iterator[sqlite3.Row]:
+        """Iterate sessions within a date range with just the columns exports need.
+        
+        Args:
+            start_date: Start date (ISO format)
+            end_date: End date (ISO format)
+            
+        Yields:
+            Rows of (task_name, start_time, end_time, elapsed_seconds) ordered
+            by start time; elapsed_seconds runs to now for running sessions
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.arraysize = 1000
+        cursor.execute(f"""
+            SELECT t.name AS task_name, s.start_time, s.end_time,
+                   {_ELAPSED_SECONDS_SQL} AS elapsed_seconds
+            FROM timer_sessions s
+            JOIN tasks t ON s.task_id = t.id
+            WHERE s.start_time >= :start AND s.start_time < :end
+            ORDER BY s.start_time
+        """, {
+            'start': start_date,
+            'end': end_date,
+            'now': datetime.now(timezone.utc).isoformat(),
+        })
+        while True:
+            rows = cursor.fetchmany()
+            if not rows:
+                break
+            yield from rows
+    
+    def get_task_totals_for_date_range(self, start_date: str, end_date: str) -> List[sqlite3.Row]:
+        """Get per-task time totals within a date range.
+        
+        Args:
+            start_date: Start date (ISO format)
+            end_date: End date (ISO format)
+            
+        Returns:
+            List of rows with task_id, task_name, total_seconds,
+            session_count and first_start_time, longest total first
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute(f"""
+            SELECT s.task_id, t.name AS task_name,
+                   SUM({_ELAPSED_SECONDS_SQL}) AS total_seconds,
+                   COUNT(*) AS session_count,
+                   MIN(s.start_time) AS first_start_time
+            FROM timer_sessions s
+            JOIN tasks t ON s.task_id = t.id
+            WHERE s.start_time >= :start AND s.start_time < :end
+            GROUP BY s.task_id
+            ORDER BY total_seconds DESC, first_start_time
+        """, {
+            'start': start_date,
+            'end': end_date,
+            'now': datetime.now(timezone.utc).isoformat(),
+        })
+        return cursor.fetchall()
+    
+    def get_daily_totals_for_date_range(self, start_date: str, end_date: str) -> List[sqlite3.Row]:
+        """Get per-day totals within a date range in a single query.
+        
+        Days are UTC calendar days, matching how timestamps are stored.
+        Days without any sessions or context switches are omitted.
+        
+        Args:
+            start_date: Start date (ISO format)
+            end_date: End date (ISO format)
+            
+        Returns:
+            List of rows with day (YYYY-MM-DD), total_seconds, task_count
+            and switch_count, ordered by day
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute(f"""
+            SELECT day,
+                   SUM(total_seconds) AS total_seconds,
+                   SUM(task_count) AS task_count,
+                   SUM(switch_count) AS switch_count
+            FROM (
+                SELECT date(start_time) AS day,
+                       SUM({_ELAPSED_SECONDS_SQL}) AS total_seconds,
+                       COUNT(DISTINCT task_id) AS task_count,
+                       0 AS switch_count
+                FROM timer_sessions
+                WHERE start_time >= :start AND start_time < :end
+                GROUP BY day
+                UNION ALL
+                SELECT date(timestamp) AS day, 0, 0, COUNT(*)
+                FROM context_switches
+                WHERE timestamp >= :start AND timestamp < :end
+                GROUP BY day
+            )
+            GROUP BY day
+            ORDER BY day
+        """, {
+            'start': start_date,
+            'end': end_date,
+            'now': datetime.now(timezone.utc).isoformat(),
+        })
+        return cursor.fetchall()
+    
     # Context switch operations
     def log_context_switch(self, from_task_id: Optional[int], to_task_id: int):
         """Log a context switch.
@@ -376,6 +628,24 @@ class Database:
         """, (start_date, end_date))
         return cursor.fetchall()
     
+    def count_context_switches_for_date_range(self, start_date: str, end_date: str) -> int:
+        """Count context switches within a date range.
+        
+        Args:
+            start_date: Start date (ISO format)
+            end_date: End date (ISO format)
+            
+        Returns:
+            Number of context switches
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT COUNT(*) FROM context_switches
+            WHERE timestamp >= ? AND timestamp < ?
+        """, (start_date, end_date))
+        return cursor.fetchone()[0]
+    
     def get_setting(self, key: str) -> Optional[str]:
         """Get a setting value.
         
@@ -420,24 +690,19 @@ class Database:
         conn = self._get_connection()
         cursor = conn.cursor()
         
-        # Count sessions before deleting
-        cursor.execute("""
-            SELECT COUNT(*) as count FROM timer_sessions
-            WHERE start_time >= ? AND start_time < ?
-        """, (start_date, end_date))
-        count = cursor.fetchone()['count']
-        
         # Delete context switches first (foreign key references)
         cursor.execute("""
             DELETE FROM context_switches
             WHERE timestamp >= ? AND timestamp < ?
         """, (start_date, end_date))
         
-        # Delete sessions
+        # Delete sessions; the DELETE reports how many rows it removed, so
+        # no separate COUNT(*) pass is needed
         cursor.execute("""
             DELETE FROM timer_sessions
             WHERE start_time >= ? AND start_time < ?
         """, (start_date, end_date))
+        count = cursor.rowcount
         
         conn.commit()
         return count
@@ -451,15 +716,12 @@ class Database:
         conn = self._get_connection()
         cursor = conn.cursor()
         
-        # Count sessions before deleting
-        cursor.execute("SELECT COUNT(*) as count FROM timer_sessions")
-        count = cursor.fetchone()['count']
-        
         # Delete all context switches
         cursor.execute("DELETE FROM context_switches")
         
-        # Delete all sessions
+        # Delete all sessions, counting them as they go
         cursor.execute("DELETE FROM timer_sessions")
+        count = cursor.rowcount
         
         conn.commit()
         return count
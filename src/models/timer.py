@@ -4,7 +4,7 @@ from datetime import datetime, timezone
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class TimerSession:
     """Represents a timer session for a task."""
     
@@ -10,6 +10,8 @@ from .time_utils import (
     format_datetime
 )
 from .export import (
+    format_session_export_rows,
+    export_session_rows_to_csv,
     export_sessions_to_csv,
     export_daily_report_to_csv,
     export_weekly_report_to_csv,
@@ -26,6 +28,8 @@ __all__ = [
     'get_week_dates',
     'format_date',
     'format_datetime',
+    'format_session_export_rows',
+    'export_session_rows_to_csv',
     'export_sessions_to_csv',
     'export_daily_report_to_csv',
     'export_weekly_report_to_csv',
@@ -1,105 +1,154 @@
 """Export utilities for Context Timer application."""
 import csv
 from datetime import datetime, timezone
-from typing import List, Dict, Any
+from itertools import chain
+from operator import itemgetter
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence, Tuple, Union
 from pathlib import Path
 
+from .time_utils import format_duration
 
-def export_sessions_to_csv(sessions: List[Dict[str, Any]], output_path: str):
-    """Export timer sessions to CSV file.
+# Large write buffer so big exports go out in few write() calls
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+SESSION_FIELDS = ('task_name', 'start_time', 'end_time', 'duration_seconds', 'duration_formatted')
+SESSION_HEADER = ('Task Name', 'Start Time', 'End Time', 'Duration (seconds)', 'Duration (HH:MM:SS)')
+
+DAILY_TASK_FIELDS = ('name', 'duration_formatted', 'session_count')
+DAILY_TASK_HEADER = ('Task', 'Time Spent', 'Sessions')
+
+WEEKLY_DAY_FIELDS = ('date', 'total_time_formatted', 'context_switches', 'task_count')
+WEEKLY_DAY_HEADER = ('Date', 'Total Time', 'Context Switches', 'Tasks Worked')
+
+
+def format_session_export_rows(rows: Iterable[Sequence[Any]]) -> Iterator[Tuple[Any, ...]]:
+    """Format raw session rows for export_session_rows_to_csv.
+    
+    Times are formatted straight from the stored ISO strings:
+    "YYYY-MM-DDTHH:MM:SS..." -> "YYYY-MM-DD HH:MM:SS".
     
     Args:
-        sessions: List of session dictionaries with keys:
-                  task_name, start_time, end_time, duration_seconds, duration_formatted
+        rows: Iterable of (task_name, start_time, end_time, elapsed_seconds)
+              rows, as yielded by Database.iter_sessions_for_export
+        
+    Returns:
+        Iterator of tuples in SESSION_FIELDS order
+    """
+    return (
+        (
+            task_name or 'Unknown',
+            start_time[:19].replace('T', ' ') if start_time else '',
+            end_time[:19].replace('T', ' ') if end_time else 'Running',
+            elapsed_seconds,
+            format_duration(elapsed_seconds)
+        )
+        for task_name, start_time, end_time, elapsed_seconds in rows
+    )
+
+
+def export_session_rows_to_csv(rows: Iterable[Sequence[Any]], output_path: Union[str, Path]) -> int:
+    """Export timer session rows to CSV file.
+    
+    Args:
+        rows: Iterable of tuples in SESSION_FIELDS order
         output_path: Path to output CSV file
+        
+    Returns:
+        Number of session rows written
     """
-    if not sessions:
-        # Create empty file with headers
-        with open(output_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(['Task Name', 'Start Time', 'End Time', 'Duration (seconds)', 'Duration (HH:MM:SS)'])
-        return
+    written = 0
     
-    with open(output_path, 'w', newline='', encoding='utf-8') as f:
-        fieldnames = ['task_name', 'start_time', 'end_time', 'duration_seconds', 'duration_formatted']
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
+    def counted_rows():
+        nonlocal written
+        for row in rows:
+            written += 1
+            yield row
+    
+    with open(output_path, 'w', newline='', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+        writer = csv.writer(f)
+        writer.writerow(SESSION_HEADER)
         
-        # Write header with friendly names
-        writer.writerow({
-            'task_name': 'Task Name',
-            'start_time': 'Start Time',
-            'end_time': 'End Time',
-            'duration_seconds': 'Duration (seconds)',
-            'duration_formatted': 'Duration (HH:MM:SS)'
-        })
+        # Rows stream straight through; an empty iterable leaves just the header
+        writer.writerows(counted_rows())
+    return written
+
+
+def export_sessions_to_csv(sessions: Iterable[Dict[str, Any]], output_path: Union[str, Path]) -> int:
+    """Export timer sessions to CSV file.
+    
+    Args:
+        sessions: Iterable of session dictionaries with keys:
+                  task_name, start_time, end_time, duration_seconds, duration_formatted
+        output_path: Path to output CSV file
         
-        writer.writerows(sessions)
+    Returns:
+        Number of sessions written
+    """
+    return export_session_rows_to_csv(map(itemgetter(*SESSION_FIELDS), sessions), output_path)
 
 
-def export_daily_report_to_csv(report_data: Dict[str, Any], output_path: str):
+def export_daily_report_to_csv(report_data: Dict[str, Any], output_path: Union[str, Path]):
     """Export daily report to CSV file.
     
     Args:
         report_data: Dictionary containing report data
         output_path: Path to output CSV file
     """
-    with open(output_path, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-        
-        # Header
-        writer.writerow(['Context Timer - Daily Report'])
-        writer.writerow([f"Date: {report_data.get('date', '')}"])
-        writer.writerow([])
-        
-        # Summary
-        writer.writerow(['Summary'])
-        writer.writerow(['Total Tasks Worked On', report_data.get('total_tasks', 0)])
-        writer.writerow(['Total Context Switches', report_data.get('total_switches', 0)])
-        writer.writerow(['Total Time Worked', report_data.get('total_time_formatted', '00:00:00')])
-        writer.writerow([])
-        
-        # Task breakdown
-        writer.writerow(['Task', 'Time Spent', 'Sessions'])
-        for task in report_data.get('tasks', []):
-            writer.writerow([
-                task['name'],
-                task['duration_formatted'],
-                task['session_count']
-            ])
+    with open(output_path, 'w', newline='', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+        csv.writer(f).writerows(chain(
+            (
+                # Header
+                ['Context Timer - Daily Report'],
+                [f"Date: {report_data.get('date', '')}"],
+                [],
+                
+                # Summary
+                ['Summary'],
+                ['Total Tasks Worked On', report_data.get('total_tasks', 0)],
+                ['Total Context Switches', report_data.get('total_switches', 0)],
+                ['Total Time Worked', report_data.get('total_time_formatted', '00:00:00')],
+                [],
+                
+                # Task breakdown
+                DAILY_TASK_HEADER,
+            ),
+            map(itemgetter(*DAILY_TASK_FIELDS), report_data.get('tasks', []))
+        ))
 
 
-def export_weekly_report_to_csv(report_data: Dict[str, Any], output_path: str):
+def export_weekly_report_to_csv(report_data: Dict[str, Any], output_path: Union[str, Path]):
     """Export weekly report to CSV file.
     
+    Day rows are written as they are read, so ``report_data['days']`` may be
+    any iterable, including a generator.
+    
     Args:
         report_data: Dictionary containing report data
         output_path: Path to output CSV file
     """
-    with open(output_path, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-        
-        # Header
-        writer.writerow(['Context Timer - Weekly Report'])
-        writer.writerow([f"Week: {report_data.get('week_start', '')} - {report_data.get('week_end', '')}"])
-        writer.writerow([])
-        
-        # Daily breakdown
-        writer.writerow(['Date', 'Total Time', 'Context Switches', 'Tasks Worked'])
-        for day in report_data.get('days', []):
-            writer.writerow([
-                day['date'],
-                day['total_time_formatted'],
-                day['context_switches'],
-                day['task_count']
-            ])
-        
-        writer.writerow([])
-        
-        # Weekly summary
-        writer.writerow(['Weekly Summary'])
-        writer.writerow(['Total Time Worked', report_data.get('total_time_formatted', '00:00:00')])
-        writer.writerow(['Total Context Switches', report_data.get('total_switches', 0)])
-        writer.writerow(['Average Daily Time', report_data.get('average_daily_time', '00:00:00')])
+    with open(output_path, 'w', newline='', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+        csv.writer(f).writerows(chain(
+            (
+                # Header
+                ['Context Timer - Weekly Report'],
+                [f"Week: {report_data.get('week_start', '')} - {report_data.get('week_end', '')}"],
+                [],
+                
+                # Daily breakdown
+                WEEKLY_DAY_HEADER,
+            ),
+            map(itemgetter(*WEEKLY_DAY_FIELDS), report_data.get('days', [])),
+            (
+                [],
+                
+                # Weekly summary
+                ['Weekly Summary'],
+                ['Total Time Worked', report_data.get('total_time_formatted', '00:00:00')],
+                ['Total Context Switches', report_data.get('total_switches', 0)],
+                ['Average Daily Time', report_data.get('average_daily_time', '00:00:00')],
+            )
+        ))
 
 
 def get_default_export_path() -> Path:
@@ -113,18 +162,23 @@ def get_default_export_path() -> Path:
     return export_dir
 
 
-def generate_export_filename(report_type: str, date_str: str = None) -> str:
+def generate_export_filename(report_type: str, date_str: str = None,
+                             now: Optional[datetime] = None) -> str:
     """Generate filename for export.
     
     Args:
         report_type: Type of report ('sessions', 'daily', 'weekly')
         date_str: Optional date string to include in filename
+        now: Current UTC time, so the filename matches the caller's report
         
     Returns:
         Generated filename
     """
+    if now is None:
+        now = datetime.now(timezone.utc)
     if date_str is None:
-        date_str = datetime.now(timezone.utc).strftime("%Y%m%d")
+        stamp = now.strftime("%Y%m%d-%H%M%S")
+    else:
+        stamp = f"{date_str}-{now.strftime('%H%M%S')}"
     
-    timestamp = datetime.now(timezone.utc).strftime("%H%M%S")
-    return f"context-timer-{report_type}-{date_str}-{timestamp}.csv"
+    return f"context-timer-{report_type}-{stamp}.csv"
@@ -1,35 +1,40 @@
 """Time formatting utilities for Context Timer application."""
-from datetime import datetime, timedelta, timezone
-from typing import Tuple
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 
+@lru_cache(maxsize=4096)
 def format_duration(seconds: int) -> str:
     """Format duration in seconds to HH:MM:SS string.
     
+    Results are memoized; reports format the same totals on every refresh.
+    
     Args:
         seconds: Duration in seconds
         
     Returns:
         Formatted string (HH:MM:SS)
     """
-    hours = seconds // 3600
-    minutes = (seconds % 3600) // 60
-    secs = seconds % 60
+    minutes, secs = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
     return f"{hours:02d}:{minutes:02d}:{secs:02d}"
 
 
+@lru_cache(maxsize=4096)
 def format_duration_verbose(seconds: int) -> str:
     """Format duration in seconds to verbose string.
     
+    Results are memoized like format_duration.
+    
     Args:
         seconds: Duration in seconds
         
     Returns:
         Formatted string like "2h 15m 30s"
     """
-    hours = seconds // 3600
-    minutes = (seconds % 3600) // 60
-    secs = seconds % 60
+    minutes, secs = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
     
     parts = []
     if hours > 0:
@@ -42,65 +47,90 @@ def format_duration_verbose(seconds: int) -> str:
     return " ".join(parts)
 
 
-def get_date_range_for_today() -> Tuple[str, str]:
+@lru_cache(maxsize=16)
+def _day_range(day: date, tz: Optional[tzinfo]) -> Tuple[str, str]:
+    """ISO range from midnight on day to the following midnight."""
+    start_of_day = datetime(day.year, day.month, day.day, tzinfo=tz)
+    end_of_day = start_of_day + timedelta(days=1)
+    return start_of_day.isoformat(), end_of_day.isoformat()
+
+
+@lru_cache(maxsize=16)
+def _week_dates(day: date, tz: Optional[tzinfo]) -> Tuple[datetime, ...]:
+    """Midnights from Monday to Sunday of the week containing day."""
+    monday = datetime(day.year, day.month, day.day, tzinfo=tz) - timedelta(days=day.weekday())
+    return tuple(monday + timedelta(days=i) for i in range(7))
+
+
+@lru_cache(maxsize=16)
+def _week_range(day: date, tz: Optional[tzinfo]) -> Tuple[str, str]:
+    """ISO range from Monday midnight to the next Monday for day's week."""
+    start_of_week = _week_dates(day, tz)[0]
+    end_of_week = start_of_week + timedelta(days=7)
+    return start_of_week.isoformat(), end_of_week.isoformat()
+
+
+@lru_cache(maxsize=16)
+def _month_range(day: date, tz: Optional[tzinfo]) -> Tuple[str, str]:
+    """ISO range from the first of day's month to the first of the next."""
+    start_of_month = datetime(day.year, day.month, 1, tzinfo=tz)
+    # First day of next month; December rolls over into January
+    end_of_month = datetime(day.year + day.month // 12, day.month % 12 + 1, 1, tzinfo=tz)
+    return start_of_month.isoformat(), end_of_month.isoformat()
+
+
+def get_date_range_for_today(now: Optional[datetime] = None) -> Tuple[str, str]:
     """Get ISO format date range for today.
     
+    Ranges are memoized per day, so repeated report refreshes reuse them.
+    
+    Args:
+        now: Current UTC time, if the caller already has it
+        
     Returns:
         Tuple of (start_of_day, end_of_day) in ISO format
     """
-    now = datetime.now(timezone.utc)
-    start_of_day = now.replace(hour=0, minute=0, second=0, microsecond=0)
-    end_of_day = start_of_day + timedelta(days=1)
-    return start_of_day.isoformat(), end_of_day.isoformat()
+    if now is None:
+        now = datetime.now(timezone.utc)
+    return _day_range(now.date(), now.tzinfo)
 
 
-def get_date_range_for_week() -> Tuple[str, str]:
+def get_date_range_for_week(now: Optional[datetime] = None) -> Tuple[str, str]:
     """Get ISO format date range for current week (Monday to Sunday).
     
+    Args:
+        now: Current UTC time, if the caller already has it
+        
     Returns:
         Tuple of (start_of_week, end_of_week) in ISO format
     """
-    now = datetime.now(timezone.utc)
-    # Get Monday of current week
-    days_since_monday = now.weekday()
-    start_of_week = (now - timedelta(days=days_since_monday)).replace(
-        hour=0, minute=0, second=0, microsecond=0
-    )
-    end_of_week = start_of_week + timedelta(days=7)
-    return start_of_week.isoformat(), end_of_week.isoformat()
+    if now is None:
+        now = datetime.now(timezone.utc)
+    return _week_range(now.date(), now.tzinfo)
 
 
-def get_date_range_for_month() -> Tuple[str, str]:
+def get_date_range_for_month(now: Optional[datetime] = None) -> Tuple[str, str]:
     """Get ISO format date range for current month.
     
+    Args:
+        now: Current UTC time, if the caller already has it
+        
     Returns:
         Tuple of (start_of_month, end_of_month) in ISO format
     """
-    now = datetime.now(timezone.utc)
-    start_of_month = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-    
-    # Get first day of next month
-    if now.month == 12:
-        end_of_month = start_of_month.replace(year=now.year + 1, month=1)
-    else:
-        end_of_month = start_of_month.replace(month=now.month + 1)
-    
-    return start_of_month.isoformat(), end_of_month.isoformat()
+    if now is None:
+        now = datetime.now(timezone.utc)
+    return _month_range(now.date(), now.tzinfo)
 
 
-def get_week_dates() -> list:
+def get_week_dates() -> List[datetime]:
     """Get list of dates for current week (Monday to Sunday).
     
     Returns:
         List of datetime objects for each day of the week
     """
     now = datetime.now(timezone.utc)
-    days_since_monday = now.weekday()
-    monday = (now - timedelta(days=days_since_monday)).replace(
-        hour=0, minute=0, second=0, microsecond=0
-    )
-    
-    return [monday + timedelta(days=i) for i in range(7)]
+    return list(_week_dates(now.date(), now.tzinfo))
 
 
 def format_date(dt: datetime) -> str:
@@ -112,7 +142,13 @@ def format_date(dt: datetime) -> str:
     Returns:
         Formatted string like "Jan 11, 2026"
     """
-    return dt.strftime("%b %d, %Y")
+    return _format_day(dt.date())
+
+
+@lru_cache(maxsize=64)
+def _format_day(day: date) -> str:
+    """Memoized format_date; reports relabel the same days on every refresh."""
+    return day.strftime("%b %d, %Y")
 
 
 def format_datetime(dt: datetime) -> str:
@@ -0,0 +1,47 @@
+"""Shared fixtures for the test suite."""
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def make_row():
+    """Build standalone sqlite3.Row objects for from_db_row tests.
+    
+    Rows are selected from literal values on one shared in-memory
+    connection, so no table has to be created per test.
+    
+    Returns:
+        Function taking column=value keyword arguments and returning a Row
+    """
+    conn = sqlite3.connect(':memory:')
+    conn.row_factory = sqlite3.Row
+    
+    def make_row(**columns):
+        select = ", ".join(f"? AS {name}" for name in columns)
+        return conn.execute(f"SELECT {select}", tuple(columns.values())).fetchone()
+    
+    yield make_row
+    conn.close()
+
+
+@pytest.fixture
+def day_range():
+    """Dates around the current UTC time, read once per test.
+    
+    The clock is read before the test body runs, so rows the test writes
+    always fall before end even if midnight passes meanwhile.
+    
+    Returns:
+        Namespace with now, yesterday and last_week datetimes, and end
+        (a day after now) in ISO format
+    """
+    now = datetime.now(timezone.utc)
+    return SimpleNamespace(
+        now=now,
+        yesterday=now - timedelta(days=1),
+        last_week=now - timedelta(days=7),
+        end=(now + timedelta(days=1)).isoformat()
+    )
@@ -1,7 +1,5 @@
 """Unit tests for GUI components."""
 import pytest
-import tempfile
-import os
 from datetime import datetime, timezone
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import Qt
@@ -21,13 +19,21 @@ def qapp():
 
 @pytest.fixture
 def test_db():
-    """Create a temporary database for testing."""
-    fd, path = tempfile.mkstemp()
-    db = Database(path)
+    """Create an in-memory database for testing."""
+    db = Database(":memory:")
     yield db
     db.close()
-    os.close(fd)
-    os.unlink(path)
+
+
+@pytest.fixture
+def window(qapp, tmp_path, monkeypatch):
+    """Create a MainWindow whose database lives under a temporary HOME."""
+    from src.gui.main_window import MainWindow
+    
+    monkeypatch.setenv("HOME", str(tmp_path))
+    window = MainWindow()
+    yield window
+    window.db.close()
 
 
 def test_task_dialog_creation(qapp):
@@ -62,6 +68,19 @@ def test_task_dialog_get_data(qapp):
     assert color == "#00ff00"
 
 
+def test_task_dialog_is_dark_color(qapp):
+    """Test TaskDialog picks button text color from the shared cached check."""
+    from src.gui.colors import is_dark_color
+    
+    assert TaskDialog.is_dark_color("#000000") is True
+    assert TaskDialog.is_dark_color("#ffffff") is False
+    assert TaskDialog.is_dark_color("navy") is True
+    
+    hits = is_dark_color.cache_info().hits
+    TaskDialog.is_dark_color("#000000")
+    assert is_dark_color.cache_info().hits == hits + 1
+
+
 def test_task_dialog_validation_empty_name(qapp):
     """Test task dialog validation with empty name."""
     dialog = TaskDialog()
@@ -105,31 +124,254 @@ def test_preferences_dialog_load(qapp, test_db):
     assert time.minute() == 15
 
 
-def test_main_window_task_button_color():
+def test_main_window_task_button_color(window):
     """Test task button color determination."""
-    from src.gui.main_window import MainWindow
-    from PyQt6.QtGui import QColor
+    # Test dark color detection
+    assert window.is_dark_color("#000000") is True
+    assert window.is_dark_color("#ffffff") is False
+    assert window.is_dark_color("#000080") is True   # Navy blue
     
-    # Test with a temporary database
-    fd, path = tempfile.mkstemp()
+    # Red has low luminance by the RGB luminance formula
+    # 0.299 * 255 + 0.587 * 0 + 0.114 * 0 = 76.245/255 = 0.299 which is < 0.5
+    assert window.is_dark_color("#ff0000") is True
     
-    try:
-        window = MainWindow()
+    # Non-#rrggbb forms fall back to QColor parsing
+    assert window.is_dark_color("#fff") is False
+    assert window.is_dark_color("navy") is True
+
+
+def test_main_window_load_tasks_reuses_buttons(window):
+    """Test reloading tasks updates existing buttons instead of recreating them."""
+    first_id = window.db.create_task("Alpha", "#ff0000")
+    second_id = window.db.create_task("Beta", "#00ff00")
+    window.load_tasks()
+    first_button = window.task_buttons[first_id]
+    
+    window.db.update_task(second_id, name="Gamma")
+    window.load_tasks()
+    assert window.task_buttons[first_id] is first_button
+    assert window.task_buttons[second_id].text() == "Start Gamma"
+    
+    first_button.click()
+    assert first_id in window.task_sessions
+    first_button.click()
+    assert first_id not in window.task_sessions
+    
+    window.db.delete_task(second_id)
+    window.load_tasks()
+    assert set(window.task_buttons) == {first_id}
+    assert window.task_buttons[first_id] is first_button
+
+
+def test_main_window_renders_report_when_tab_shown(window):
+    """Test reports are rendered lazily when their tab becomes current."""
+    window.refresh_visible_reports()
+    assert window.daily_report_text.toPlainText() == ""
+    
+    window.tabs.setCurrentWidget(window.daily_tab)
+    assert "DAILY REPORT" in window.daily_report_text.toPlainText()
+    assert window.weekly_report_text.toPlainText() == ""
+    
+    window.tabs.setCurrentWidget(window.weekly_tab)
+    assert "WEEKLY REPORT" in window.weekly_report_text.toPlainText()
+
+
+def test_main_window_exports_reuse_rendered_report_totals(window, monkeypatch):
+    """Test report totals are reused for exports until the data changes."""
+    from src.utils import get_date_range_for_today, get_week_dates
+    
+    # Cached totals are only reused while no timer is running
+    assert not window.has_running_timers()
+    window.tabs.setCurrentWidget(window.daily_tab)
+    window.tabs.setCurrentWidget(window.weekly_tab)
+    
+    def fail(*args):
+        raise AssertionError("report totals queried again")
+    monkeypatch.setattr(window.db, "get_task_totals_for_date_range", fail)
+    monkeypatch.setattr(window.db, "get_daily_totals_for_date_range", fail)
+    
+    assert window.get_day_totals(*get_date_range_for_today()) == ([], 0)
+    assert len(window.get_week_day_totals(get_week_dates())) == 7
+    
+    window.db.create_task("Alpha", "#ff0000")
+    with pytest.raises(AssertionError):
+        window.get_day_totals(*get_date_range_for_today())
+
+
+def test_main_window_exports_sessions_in_background(qapp, window, monkeypatch):
+    """Test session CSV exports are written off the GUI thread."""
+    import csv
+    from PyQt6.QtCore import QThreadPool
+    from src.gui import main_window as main_window_module
+    from src.utils import get_date_range_for_today
+    
+    messages = []
+    monkeypatch.setattr(
+        main_window_module.QMessageBox, "information",
+        staticmethod(lambda parent, title, text: messages.append(text))
+    )
+    
+    task_id = window.db.create_task("Alpha", "#ff0000")
+    window.db.stop_session(window.db.start_session(task_id))
+    
+    window.export_sessions_csv(*get_date_range_for_today(), "test")
+    QThreadPool.globalInstance().waitForDone()
+    qapp.processEvents()
+    
+    assert not window._export_workers
+    assert len(messages) == 1
+    assert messages[0].startswith("Exported 1 timer sessions to:")
+    with open(messages[0].split("\n", 1)[1]) as f:
+        rows = list(csv.reader(f))
+    assert [row[0] for row in rows] == ['Task Name', 'Alpha']
+
+
+def test_export_worker_rejects_memory_database(tmp_path):
+    """Test the export worker fails instead of exporting an empty database."""
+    from src.gui.export_worker import SessionExportWorker
+    
+    worker = SessionExportWorker(
+        ":memory:", "2026-01-12T00:00:00", "2026-01-13T00:00:00",
+        tmp_path / "sessions.csv"
+    )
+    errors = []
+    worker.signals.failed.connect(errors.append)
+    worker.run()
+    
+    assert len(errors) == 1
+    assert not (tmp_path / "sessions.csv").exists()
+
+
+def test_main_window_special_task_ids_cached(window):
+    """Test Work Day/Lunch/Break task ids are looked up once and reused."""
+    lunch_id = window._get_or_create_special_task("Lunch", "#f39c12")
+    assert window.db.get_task_by_id(lunch_id)['name'] == "Lunch"
+    assert window._get_or_create_special_task("Lunch", "#f39c12") == lunch_id
+    assert window._special_task_ids == {"Lunch": lunch_id}
+
+
+@pytest.mark.parametrize("toggle_pause", ["toggle_lunch", "toggle_break"])
+def test_main_window_stop_work_day_closes_pause(window, toggle_pause):
+    """Test stopping Work Day during Lunch or Break leaves no session open."""
+    window.toggle_work_day()
+    getattr(window, toggle_pause)()
+    window.toggle_work_day()
+    
+    assert window.db.get_active_sessions() == []
+    assert not window.has_running_timers()
+
+
+def test_main_window_tick_uses_cached_start_times(window, monkeypatch):
+    """Test the per-second button refresh doesn't query the database."""
+    task_id = window.db.create_task("Alpha", "#ff0000")
+    window.load_tasks()
+    window.toggle_task_timer(task_id)
+    
+    def fail(*args):
+        raise AssertionError("database queried during display tick")
+    monkeypatch.setattr(window.db, "get_session_by_id", fail)
+    
+    window.update_task_button_displays()
+    assert window.task_buttons[task_id].text().startswith("Stop Alpha\n00:00:0")
+    
+    window.toggle_task_timer(task_id)
+    assert window._session_starts == {}
+
+
+def test_main_window_add_edit_task_updates_grid_in_place(window, monkeypatch):
+    """Test adding and editing a task only touches that task's button."""
+    import src.gui.main_window as main_window_module
+    
+    class FakeDialog:
+        data = ("", "")
         
-        # Test dark color detection
-        assert window.is_dark_color("#000000") is True
-        assert window.is_dark_color("#ffffff") is False
-        assert window.is_dark_color("#000080") is True   # Navy blue
+        def __init__(self, *args):
+            pass
         
-        # Red has low luminance by the RGB luminance formula
-        # 0.299 * 255 + 0.587 * 0 + 0.114 * 0 = 76.245/255 = 0.299 which is < 0.5
-        assert window.is_dark_color("#ff0000") is True
+        def exec(self):
+            return True
         
-        window.db.close()
+        def get_task_data(self):
+            return FakeDialog.data
+    
+    monkeypatch.setattr(main_window_module, "TaskDialog", FakeDialog)
+    
+    beta_id = window.db.create_task("Beta", "#00ff00")
+    window.load_tasks()
+    beta_button = window.task_buttons[beta_id]
+    
+    FakeDialog.data = ("Alpha", "#ff0000")
+    window.add_task()
+    (alpha_id,) = set(window.task_buttons) - {beta_id}
+    assert window.task_buttons[alpha_id].text() == "Start Alpha"
+    assert window.task_buttons[beta_id] is beta_button
+    assert window._task_button_order == [alpha_id, beta_id]
+    
+    FakeDialog.data = ("Gamma", "#0000ff")
+    window.selected_task_id = alpha_id
+    window.edit_task()
+    assert window.task_buttons[alpha_id].text() == "Start Gamma"
+    assert window._task_button_order == [beta_id, alpha_id]
+
+
+def test_main_window_display_tick_follows_visibility(window):
+    """Test the per-second display tick only runs while a timer is shown."""
+    assert not window.display_timer.isActive()
+    
+    window.show()
+    assert not window.display_timer.isActive()
+    
+    task_id = window.db.create_task("Alpha", "#3498db")
+    window.toggle_task_timer(task_id)
+    assert window.display_timer.isActive()
+    
+    window.hide()
+    assert not window.display_timer.isActive()
+    
+    window.show()
+    window.toggle_task_timer(task_id)
+    assert not window.display_timer.isActive()
+
+
+def test_main_window_report_tick_follows_tab_and_timers(window):
+    """Test the report tick only runs while a shown report has running totals."""
+    task_id = window.db.create_task("Alpha", "#3498db")
+    window.show()
+    window.toggle_task_timer(task_id)
+    assert not window.report_timer.isActive()
+    
+    window.tabs.setCurrentWidget(window.daily_tab)
+    assert window.report_timer.isActive()
+    
+    window.hide()
+    assert not window.report_timer.isActive()
+    
+    window.show()
+    assert window.report_timer.isActive()
+    
+    window.toggle_task_timer(task_id)
+    assert not window.report_timer.isActive()
+
+
+def test_main_window_restores_running_timer(qapp, tmp_path, monkeypatch):
+    """Test a session left running is picked up by a new window."""
+    from src.gui.main_window import MainWindow
+    from src.models import Database
+    
+    monkeypatch.setenv("HOME", str(tmp_path))
+    db = Database()
+    task_id = db.create_task("Alpha", "#3498db")
+    session_id = db.start_session(task_id)
+    db.close()
+    
+    window = MainWindow()
+    
+    try:
+        assert window.task_sessions[task_id] == session_id
+        window.show()
+        assert window.display_timer.isActive()
     finally:
-        os.close(fd)
-        if os.path.exists(path):
-            os.unlink(path)
+        window.db.close()
 
 
 def test_timer_widget_creation(qapp):
@@ -178,3 +420,41 @@ def test_timer_widget_stop_callback(qapp):
     
     # Verify stop button exists
     assert widget.stop_button is not None
+
+
+def test_timer_widgets_share_one_ticker(qapp):
+    """Test running TimerWidgets are refreshed from one shared timer."""
+    from datetime import timedelta
+    from src.gui.timer_widget import TimerWidget
+    
+    start = datetime.now(timezone.utc)
+    first = TimerWidget(1, 1, "First", "#ff0000", start)
+    second = TimerWidget(2, 2, "Second", "#00ff00", start - timedelta(hours=1))
+    
+    ticker = TimerWidget.shared_ticker()
+    assert ticker.isActive()
+    
+    TimerWidget._tick()
+    assert first.time_label.text().startswith("00:00:0")
+    assert second.time_label.text().startswith("01:00:0")
+    
+    first.stop()
+    assert ticker.isActive()
+    second.stop()
+    assert not ticker.isActive()
+
+
+def test_timer_widget_stylesheet_shared_per_color(qapp):
+    """Test TimerWidgets of the same color reuse one stylesheet string."""
+    from src.gui.timer_widget import TimerWidget
+    
+    start = datetime.now(timezone.utc)
+    first = TimerWidget(1, 1, "First", "#ff0000", start)
+    second = TimerWidget(2, 2, "Second", "#ff0000", start)
+    
+    assert first.styleSheet() == second.styleSheet()
+    assert "border: 2px solid #ff0000" in first.styleSheet()
+    assert first.time_label.font().bold()
+    
+    first.stop()
+    second.stop()
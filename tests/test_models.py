@@ -1,22 +1,30 @@
 """Unit tests for database models."""
 import pytest
-import tempfile
-import os
+import sqlite3
 from datetime import datetime, timezone, timedelta
 from src.models.database import Database
 from src.models.task import Task
 from src.models.timer import TimerSession
 
+# Bounds for queries that should match every row a test has written
+EPOCH_ISO = "2000-01-01T00:00:00+00:00"
+FAR_FUTURE_ISO = "2999-01-01T00:00:00+00:00"
+
 
 @pytest.fixture
 def test_db():
-    """Create a temporary database for testing."""
-    fd, path = tempfile.mkstemp()
-    db = Database(path)
+    """Create an in-memory database for testing."""
+    db = Database(":memory:")
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def file_db(tmp_path):
+    """Create an on-disk database, for behaviour :memory: can't show."""
+    db = Database(str(tmp_path / "timers.db"))
     yield db
     db.close()
-    os.close(fd)
-    os.unlink(path)
 
 
 def test_create_task(test_db):
@@ -33,6 +41,18 @@ def test_create_task(test_db):
     assert task.is_active is True
 
 
+def test_upsert_special_task(test_db):
+    """Test upserting a task returns the same id on repeat calls."""
+    task_id = test_db.upsert_special_task("Lunch", "#f39c12")
+    assert test_db.get_task_by_id(task_id)['name'] == "Lunch"
+    
+    # Existing task keeps its id and original color, and isn't rewritten
+    total_changes = test_db._get_connection().total_changes
+    assert test_db.upsert_special_task("Lunch", "#000000") == task_id
+    assert test_db.get_task_by_id(task_id)['color'] == "#f39c12"
+    assert test_db._get_connection().total_changes == total_changes
+
+
 def test_get_all_tasks(test_db):
     """Test getting all tasks."""
     test_db.create_task("Task 1", "#ff0000")
@@ -82,21 +102,69 @@ def test_start_session(test_db):
     assert session.is_running is True
 
 
+def test_models_use_slots():
+    """Test that model instances do not carry a per-instance __dict__."""
+    task = Task(id=1, name="Test Task")
+    session = TimerSession(id=1, task_id=1, start_time=datetime.now(timezone.utc))
+    
+    assert not hasattr(task, '__dict__')
+    assert not hasattr(session, '__dict__')
+
+
 def test_stop_session(test_db):
     """Test stopping a timer session."""
     task_id = test_db.create_task("Test Task")
     session_id = test_db.start_session(task_id)
     
-    # Wait a moment to ensure duration > 0
-    import time
-    time.sleep(0.1)
-    
     test_db.stop_session(session_id)
     
     active_sessions = test_db.get_active_sessions()
     assert len(active_sessions) == 0
 
 
+def test_stop_session_duration(test_db):
+    """Test that stopping a session stores the elapsed whole seconds."""
+    task_id = test_db.create_task("Test Task")
+    session_id = test_db.start_session(task_id)
+    start_time = datetime.now(timezone.utc) - timedelta(seconds=90.25)
+    conn = test_db._get_connection()
+    conn.execute(
+        "UPDATE timer_sessions SET start_time = ? WHERE id = ?",
+        (start_time.isoformat(), session_id)
+    )
+    conn.commit()
+    
+    test_db.stop_session(session_id)
+    
+    session = test_db.get_session_by_id(session_id)
+    assert session['end_time'] is not None
+    assert session['duration_seconds'] == 90
+
+
+def test_stop_sessions(test_db):
+    """Test stopping several sessions at once."""
+    task1_id = test_db.create_task("Task 1")
+    task2_id = test_db.create_task("Task 2")
+    task3_id = test_db.create_task("Task 3")
+    
+    session1_id = test_db.start_session(task1_id)
+    session2_id = test_db.start_session(task2_id)
+    session3_id = test_db.start_session(task3_id)
+    
+    test_db.stop_sessions([session1_id, session2_id])
+    
+    active_sessions = test_db.get_active_sessions()
+    assert [row['id'] for row in active_sessions] == [session3_id]
+    
+    stopped1 = test_db.get_session_by_id(session1_id)
+    stopped2 = test_db.get_session_by_id(session2_id)
+    assert stopped1['end_time'] == stopped2['end_time']
+    assert stopped1['duration_seconds'] >= 0
+    
+    # An empty batch is a no-op
+    test_db.stop_sessions([])
+
+
 def test_multiple_active_sessions(test_db):
     """Test multiple concurrent sessions."""
     task1_id = test_db.create_task("Task 1")
@@ -109,6 +177,19 @@ def test_multiple_active_sessions(test_db):
     assert len(active_sessions) == 2
 
 
+def test_get_startup_snapshot(test_db):
+    """Test reading tasks, running sessions and start time together."""
+    task_id = test_db.create_task("Task 1")
+    session_id = test_db.start_session(task_id)
+    test_db.set_setting('expected_start_time', '09:00')
+    
+    tasks, sessions, expected_start_time = test_db.get_startup_snapshot()
+    assert [row['name'] for row in tasks] == ["Task 1"]
+    assert [row['id'] for row in sessions] == [session_id]
+    assert expected_start_time == '09:00'
+    assert not test_db._get_connection().in_transaction
+
+
 def test_log_context_switch(test_db):
     """Test logging context switches."""
     task1_id = test_db.create_task("Task 1")
@@ -117,12 +198,27 @@ def test_log_context_switch(test_db):
     test_db.log_context_switch(None, task1_id)
     test_db.log_context_switch(task1_id, task2_id)
     
-    now = datetime.now(timezone.utc)
-    start_of_day = now.replace(hour=0, minute=0, second=0, microsecond=0).isoformat()
-    end_of_day = (now + timedelta(days=1)).isoformat()
-    
-    switches = test_db.get_context_switches_for_date_range(start_of_day, end_of_day)
+    switches = test_db.get_context_switches_for_date_range(EPOCH_ISO, FAR_FUTURE_ISO)
     assert len(switches) == 2
+    assert test_db.count_context_switches_for_date_range(EPOCH_ISO, FAR_FUTURE_ISO) == 2
+
+
+def test_start_task_session(test_db):
+    """Test starting a session logs its context switch in the same write."""
+    task1_id = test_db.create_task("Task 1")
+    task2_id = test_db.create_task("Task 2")
+    
+    session_id, start_time = test_db.start_task_session(task2_id, task1_id)
+    
+    session = test_db.get_session_by_id(session_id)
+    assert session['task_id'] == task2_id
+    assert session['start_time'] == start_time
+    assert session['end_time'] is None
+    
+    switches = test_db.get_context_switches_for_date_range(start_time, start_time + "~")
+    assert [(row['from_task_id'], row['to_task_id'], row['timestamp']) for row in switches] == [
+        (task1_id, task2_id, start_time)
+    ]
 
 
 def test_get_sessions_for_date_range(test_db):
@@ -131,14 +227,141 @@ def test_get_sessions_for_date_range(test_db):
     session_id = test_db.start_session(task_id)
     test_db.stop_session(session_id)
     
-    now = datetime.now(timezone.utc)
-    start_of_day = now.replace(hour=0, minute=0, second=0, microsecond=0).isoformat()
-    end_of_day = (now + timedelta(days=1)).isoformat()
-    
-    sessions = test_db.get_sessions_for_date_range(start_of_day, end_of_day)
+    sessions = test_db.get_sessions_for_date_range(EPOCH_ISO, FAR_FUTURE_ISO)
     assert len(sessions) == 1
 
 
+def test_get_earliest_session_time(test_db):
+    """Test earliest session start time lookup."""
+    assert test_db.get_earliest_session_time() is None
+    
+    task_id = test_db.create_task("Test Task")
+    first_id = test_db.start_session(task_id)
+    test_db.start_session(task_id)
+    
+    first = test_db.get_session_by_id(first_id)
+    assert test_db.get_earliest_session_time() == first['start_time']
+
+
+def test_iter_sessions_for_export(test_db):
+    """Test export rows carry task name, raw timestamps and elapsed seconds."""
+    task_id = test_db.create_task("Test Task")
+    start = datetime(2026, 1, 12, 9, 0, 0, tzinfo=timezone.utc)
+    
+    conn = test_db._get_connection()
+    conn.execute("""
+        INSERT INTO timer_sessions (task_id, start_time, end_time, duration_seconds)
+        VALUES (?, ?, ?, ?)
+    """, (task_id, start.isoformat(), (start + timedelta(minutes=10)).isoformat(), 600))
+    conn.commit()
+    running_id = test_db.start_session(task_id)
+    
+    rows = [tuple(row) for row in test_db.iter_sessions_for_export(
+        start.replace(hour=0).isoformat(),
+        (datetime.now(timezone.utc) + timedelta(days=1)).isoformat()
+    )]
+    
+    assert rows[0] == (
+        "Test Task", start.isoformat(), (start + timedelta(minutes=10)).isoformat(), 600
+    )
+    assert rows[1][0] == "Test Task"
+    assert rows[1][1] == test_db.get_session_by_id(running_id)['start_time']
+    assert rows[1][2] is None
+    assert 0 <= rows[1][3] <= 1
+
+
+def test_read_only_database(file_db, tmp_path):
+    """Test a read-only Database reads existing rows without writing."""
+    file_db.create_task("Test Task")
+    
+    reader = Database(file_db.db_path, read_only=True)
+    try:
+        assert [row['name'] for row in reader.get_all_tasks()] == ["Test Task"]
+        with pytest.raises(sqlite3.OperationalError):
+            reader.create_task("Other Task")
+    finally:
+        reader.close()
+    
+    with pytest.raises(sqlite3.OperationalError):
+        Database(str(tmp_path / "missing.db"), read_only=True)._get_connection()
+    with pytest.raises(ValueError):
+        Database(":memory:", read_only=True)
+
+
+def test_get_task_totals_for_date_range(test_db):
+    """Test per-task totals are summed in SQL, longest first."""
+    task1_id = test_db.create_task("Task 1")
+    task2_id = test_db.create_task("Task 2")
+    
+    start = datetime(2026, 1, 12, 9, 0, 0, tzinfo=timezone.utc)
+    
+    conn = test_db._get_connection()
+    cursor = conn.cursor()
+    cursor.executemany("""
+        INSERT INTO timer_sessions (task_id, start_time, end_time, duration_seconds)
+        VALUES (?, ?, ?, ?)
+    """, [
+        (task1_id, start.isoformat(), (start + timedelta(minutes=10)).isoformat(), 600),
+        (task2_id, start.isoformat(), (start + timedelta(hours=1)).isoformat(), 3600),
+        (task1_id, start.isoformat(), (start + timedelta(minutes=5)).isoformat(), 300),
+    ])
+    conn.commit()
+    
+    rows = test_db.get_task_totals_for_date_range(
+        start.replace(hour=0).isoformat(),
+        (start + timedelta(days=1)).replace(hour=0).isoformat()
+    )
+    
+    assert [row['task_name'] for row in rows] == ["Task 2", "Task 1"]
+    assert rows[0]['total_seconds'] == 3600
+    assert rows[0]['session_count'] == 1
+    assert rows[1]['total_seconds'] == 900
+    assert rows[1]['session_count'] == 2
+    assert rows[1]['first_start_time'] == start.isoformat()
+
+
+def test_get_daily_totals_for_date_range(test_db):
+    """Test per-day totals are grouped by UTC day in one query."""
+    task1_id = test_db.create_task("Task 1")
+    task2_id = test_db.create_task("Task 2")
+    
+    day1 = datetime(2026, 1, 12, 9, 0, 0, tzinfo=timezone.utc)
+    day2 = day1 + timedelta(days=1)
+    
+    conn = test_db._get_connection()
+    cursor = conn.cursor()
+    cursor.executemany("""
+        INSERT INTO timer_sessions (task_id, start_time, end_time, duration_seconds)
+        VALUES (?, ?, ?, ?)
+    """, [
+        (task1_id, day1.isoformat(), (day1 + timedelta(hours=1)).isoformat(), 3600),
+        (task2_id, day1.isoformat(), (day1 + timedelta(minutes=30)).isoformat(), 1800),
+        (task1_id, day2.isoformat(), (day2 + timedelta(minutes=1)).isoformat(), 60),
+    ])
+    cursor.executemany("""
+        INSERT INTO context_switches (from_task_id, to_task_id, timestamp)
+        VALUES (?, ?, ?)
+    """, [
+        (None, task1_id, day1.isoformat()),
+        (task1_id, task2_id, day1.isoformat()),
+    ])
+    conn.commit()
+    
+    rows = test_db.get_daily_totals_for_date_range(
+        day1.replace(hour=0).isoformat(),
+        (day2 + timedelta(days=1)).replace(hour=0).isoformat()
+    )
+    totals = {row['day']: row for row in rows}
+    
+    assert set(totals) == {"2026-01-12", "2026-01-13"}
+    assert totals["2026-01-12"]['total_seconds'] == 5400
+    assert totals["2026-01-12"]['task_count'] == 2
+    assert totals["2026-01-12"]['switch_count'] == 2
+    assert totals["2026-01-13"]['total_seconds'] == 60
+    assert totals["2026-01-13"]['task_count'] == 1
+    assert totals["2026-01-13"]['switch_count'] == 0
+
+
 def test_get_setting(test_db):
     """Test getting a setting value."""
     # Non-existent setting should return None
@@ -199,8 +422,6 @@ def test_get_or_create_work_day_session_for_today_reopen(test_db):
     
     # Create and stop a session
     session_id_1 = test_db.start_session(task_id)
-    import time
-    time.sleep(0.1)
     test_db.stop_session(session_id_1)
     
     # Verify session is stopped
@@ -218,6 +439,50 @@ def test_get_or_create_work_day_session_for_today_reopen(test_db):
     assert session.is_running is True
 
 
+def test_connection_uses_wal(file_db):
+    """Test connections are opened with the WAL/cache tuning pragmas."""
+    conn = file_db._get_connection()
+    mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    assert mode.lower() == "wal"
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+    assert conn.execute("PRAGMA cache_size").fetchone()[0] == -20000
+    assert conn.execute("PRAGMA mmap_size").fetchone()[0] == 268435456
+
+
+def test_session_range_queries_use_covering_index(test_db):
+    """Test date-range session queries are answered from the covering index."""
+    conn = test_db._get_connection()
+    plan = " ".join(row[3] for row in conn.execute("""
+        EXPLAIN QUERY PLAN
+        SELECT task_id, SUM(duration_seconds) FROM timer_sessions
+        WHERE start_time >= ? AND start_time < ?
+        GROUP BY task_id
+    """, ("2026-01-12", "2026-01-13")))
+    assert "COVERING INDEX idx_sessions_range" in plan
+    
+    plan = " ".join(row[3] for row in conn.execute("""
+        EXPLAIN QUERY PLAN
+        SELECT id, task_id, start_time, end_time, duration_seconds FROM timer_sessions
+        WHERE start_time >= ? AND start_time < ?
+        ORDER BY start_time
+    """, ("2026-01-12", "2026-01-13")))
+    assert "COVERING INDEX idx_sessions_range" in plan
+
+
+def test_get_change_count(test_db):
+    """Test change count advances on writes but not on reads."""
+    before = test_db.get_change_count()
+    
+    task_id = test_db.create_task("Test Task")
+    after_write = test_db.get_change_count()
+    assert after_write > before
+    
+    test_db.get_all_tasks()
+    test_db.get_task_by_id(task_id)
+    assert test_db.get_change_count() == after_write
+
+
 def test_database_context_manager(test_db):
     """Test database context manager."""
     with test_db as db:
@@ -225,46 +490,26 @@ def test_database_context_manager(test_db):
         assert task_id > 0
 
 
-def test_task_from_db_row():
+def test_task_from_db_row(make_row):
     """Test creating Task from database row."""
-    import sqlite3
-    conn = sqlite3.connect(':memory:')
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-    
-    cursor.execute("""
-        CREATE TABLE tasks (
-            id INTEGER PRIMARY KEY,
-            name TEXT,
-            color TEXT,
-            created_at TEXT,
-            is_active INTEGER
-        )
-    """)
-    
-    cursor.execute("""
-        INSERT INTO tasks (name, color, created_at, is_active)
-        VALUES (?, ?, ?, ?)
-    """, ("Test", "#ff0000", datetime.now(timezone.utc).isoformat(), 1))
-    
-    cursor.execute("SELECT * FROM tasks WHERE id = 1")
-    row = cursor.fetchone()
+    row = make_row(
+        id=1, name="Test", color="#ff0000",
+        created_at=datetime.now(timezone.utc).isoformat(), is_active=1
+    )
     
     task = Task.from_db_row(row)
     assert task.name == "Test"
     assert task.color == "#ff0000"
     assert task.is_active is True
-    conn.close()
 
 
-def test_clear_history_for_date_range(test_db):
+def test_clear_history_for_date_range(test_db, day_range):
     """Test clearing history for a specific date range."""
     task_id = test_db.create_task("Test Task", "#ff0000")
     
     # Create sessions for different days
-    today = datetime.now(timezone.utc)
-    yesterday = today - timedelta(days=1)
-    last_week = today - timedelta(days=7)
+    yesterday = day_range.yesterday
+    last_week = day_range.last_week
     
     # Start and end sessions at different times
     session_today = test_db.start_session(task_id)
@@ -272,16 +517,13 @@ def test_clear_history_for_date_range(test_db):
     
     # Create yesterday's session by directly inserting (to simulate past data)
     conn = test_db._get_connection()
-    cursor = conn.cursor()
-    cursor.execute("""
+    conn.executemany("""
         INSERT INTO timer_sessions (task_id, start_time, end_time, duration_seconds)
         VALUES (?, ?, ?, ?)
-    """, (task_id, yesterday.isoformat(), (yesterday + timedelta(hours=1)).isoformat(), 3600))
-    
-    cursor.execute("""
-        INSERT INTO timer_sessions (task_id, start_time, end_time, duration_seconds)
-        VALUES (?, ?, ?, ?)
-    """, (task_id, last_week.isoformat(), (last_week + timedelta(hours=2)).isoformat(), 7200))
+    """, [
+        (task_id, yesterday.isoformat(), (yesterday + timedelta(hours=1)).isoformat(), 3600),
+        (task_id, last_week.isoformat(), (last_week + timedelta(hours=2)).isoformat(), 7200),
+    ])
     conn.commit()
     
     # Clear yesterday's sessions
@@ -297,19 +539,27 @@ def test_clear_history_for_date_range(test_db):
     # Verify today's and last week's sessions still exist
     all_sessions = test_db.get_sessions_for_date_range(
         last_week.replace(hour=0, minute=0, second=0, microsecond=0).isoformat(),
-        (today + timedelta(days=1)).isoformat()
+        day_range.end
     )
     assert len(all_sessions) == 2  # Today and last week
 
 
-def test_clear_all_history(test_db):
+def test_clear_all_history(test_db, day_range):
     """Test clearing all history."""
     task_id = test_db.create_task("Test Task", "#ff0000")
     
     # Create multiple sessions
-    for _ in range(5):
-        session_id = test_db.start_session(task_id)
-        test_db.stop_session(session_id)
+    now = day_range.now
+    conn = test_db._get_connection()
+    with conn:
+        conn.executemany("""
+            INSERT INTO timer_sessions (task_id, start_time, end_time, duration_seconds)
+            VALUES (?, ?, ?, ?)
+        """, [
+            (task_id, (now - timedelta(hours=i + 1)).isoformat(),
+             (now - timedelta(hours=i)).isoformat(), 3600)
+            for i in range(5)
+        ])
     
     # Log some context switches
     test_db.log_context_switch(None, task_id)
@@ -320,11 +570,7 @@ def test_clear_all_history(test_db):
     assert count == 5
     
     # Verify no sessions remain
-    today = datetime.now(timezone.utc)
-    sessions = test_db.get_sessions_for_date_range(
-        "2000-01-01T00:00:00+00:00",
-        (today + timedelta(days=1)).isoformat()
-    )
+    sessions = test_db.get_sessions_for_date_range(EPOCH_ISO, FAR_FUTURE_ISO)
     assert len(sessions) == 0
     
     # Verify task still exists (not deleted)
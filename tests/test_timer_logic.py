@@ -53,58 +53,30 @@ def test_get_elapsed_seconds_stopped():
     assert elapsed == 3600
 
 
-def test_get_elapsed_display():
+@pytest.mark.parametrize("duration_seconds,expected", [
+    (3661, "01:01:01"),  # 1 hour, 1 minute, 1 second
+    (36125, "10:02:05"),  # 10 hours, 2 minutes, 5 seconds
+])
+def test_get_elapsed_display(duration_seconds, expected):
     """Test formatted elapsed time display."""
     session = TimerSession(
         id=1,
         task_id=1,
         start_time=datetime.now(timezone.utc),
-        duration_seconds=3661  # 1 hour, 1 minute, 1 second
+        duration_seconds=duration_seconds
     )
     
     display = session.get_elapsed_display()
-    assert display == "01:01:01"
+    assert display == expected
 
 
-def test_get_elapsed_display_hours():
-    """Test formatted display with multiple hours."""
-    session = TimerSession(
-        id=1,
-        task_id=1,
-        start_time=datetime.now(timezone.utc),
-        duration_seconds=36125  # 10 hours, 2 minutes, 5 seconds
-    )
-    
-    display = session.get_elapsed_display()
-    assert display == "10:02:05"
-
-
-def test_timer_session_from_db_row():
+def test_timer_session_from_db_row(make_row):
     """Test creating TimerSession from database row."""
-    import sqlite3
-    conn = sqlite3.connect(':memory:')
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-    
-    cursor.execute("""
-        CREATE TABLE test (
-            id INTEGER,
-            task_id INTEGER,
-            start_time TEXT,
-            end_time TEXT,
-            duration_seconds INTEGER,
-            task_name TEXT,
-            task_color TEXT
-        )
-    """)
-    
-    start = datetime.now(timezone.utc).isoformat()
-    cursor.execute("""
-        INSERT INTO test VALUES (?, ?, ?, ?, ?, ?, ?)
-    """, (1, 10, start, None, None, "Test Task", "#ff0000"))
-    
-    cursor.execute("SELECT * FROM test WHERE id = 1")
-    row = cursor.fetchone()
+    row = make_row(
+        id=1, task_id=10, start_time=datetime.now(timezone.utc).isoformat(),
+        end_time=None, duration_seconds=None,
+        task_name="Test Task", task_color="#ff0000"
+    )
     
     session = TimerSession.from_db_row(row)
     assert session.id == 1
@@ -112,40 +84,20 @@ def test_timer_session_from_db_row():
     assert session.task_name == "Test Task"
     assert session.task_color == "#ff0000"
     assert session.is_running is True
-    conn.close()
 
 
-def test_timer_session_from_db_row_without_task_info():
+def test_timer_session_from_db_row_without_task_info(make_row):
     """Test creating TimerSession from row without task_name/color."""
-    import sqlite3
-    conn = sqlite3.connect(':memory:')
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-    
-    cursor.execute("""
-        CREATE TABLE test (
-            id INTEGER,
-            task_id INTEGER,
-            start_time TEXT,
-            end_time TEXT,
-            duration_seconds INTEGER
-        )
-    """)
-    
-    start = datetime.now(timezone.utc).isoformat()
-    cursor.execute("""
-        INSERT INTO test VALUES (?, ?, ?, ?, ?)
-    """, (1, 10, start, None, None))
-    
-    cursor.execute("SELECT * FROM test WHERE id = 1")
-    row = cursor.fetchone()
+    row = make_row(
+        id=1, task_id=10, start_time=datetime.now(timezone.utc).isoformat(),
+        end_time=None, duration_seconds=None
+    )
     
     session = TimerSession.from_db_row(row)
     assert session.id == 1
     assert session.task_id == 10
     assert session.task_name is None
     assert session.task_color is None
-    conn.close()
 
 
 def test_timer_session_zero_duration():
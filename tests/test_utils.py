@@ -5,6 +5,7 @@ from src.utils.time_utils import (
     format_duration,
     format_duration_verbose,
     get_date_range_for_today,
+    get_date_range_for_month,
     get_date_range_for_week,
     get_week_dates,
     format_date,
@@ -12,21 +13,28 @@ from src.utils.time_utils import (
 )
 
 
-def test_format_duration():
+@pytest.mark.parametrize("seconds,expected", [
+    (0, "00:00:00"),
+    (61, "00:01:01"),
+    (3661, "01:01:01"),
+    (36125, "10:02:05"),
+])
+def test_format_duration(seconds, expected):
     """Test duration formatting."""
-    assert format_duration(0) == "00:00:00"
-    assert format_duration(61) == "00:01:01"
-    assert format_duration(3661) == "01:01:01"
-    assert format_duration(36125) == "10:02:05"
+    assert format_duration(seconds) == expected
 
 
-def test_format_duration_verbose():
+@pytest.mark.parametrize("seconds,expected", [
+    (0, "0s"),
+    (61, "1m 1s"),
+    (3661, "1h 1m 1s"),
+    (3600, "1h"),
+    (60, "1m"),
+    (3605, "1h 5s"),
+])
+def test_format_duration_verbose(seconds, expected):
     """Test verbose duration formatting."""
-    assert format_duration_verbose(0) == "0s"
-    assert format_duration_verbose(61) == "1m 1s"
-    assert format_duration_verbose(3661) == "1h 1m 1s"
-    assert format_duration_verbose(3600) == "1h"
-    assert format_duration_verbose(60) == "1m"
+    assert format_duration_verbose(seconds) == expected
 
 
 def test_get_date_range_for_today():
@@ -59,6 +67,37 @@ def test_get_date_range_for_week():
     assert (end_dt - start_dt).days == 7
 
 
+def test_date_ranges_for_given_time():
+    """Test date ranges are computed from a caller-supplied time."""
+    now = datetime(2026, 1, 15, 23, 59, 59, tzinfo=timezone.utc)
+    assert get_date_range_for_today(now) == (
+        "2026-01-15T00:00:00+00:00", "2026-01-16T00:00:00+00:00"
+    )
+    assert get_date_range_for_week(now) == (
+        "2026-01-12T00:00:00+00:00", "2026-01-19T00:00:00+00:00"
+    )
+    assert get_date_range_for_month(now) == (
+        "2026-01-01T00:00:00+00:00", "2026-02-01T00:00:00+00:00"
+    )
+
+
+def test_date_ranges_are_memoized_per_day():
+    """Test that date ranges are reused for any time on the same day."""
+    morning = datetime(2026, 12, 31, 0, 0, 1, tzinfo=timezone.utc)
+    evening = datetime(2026, 12, 31, 23, 59, 59, tzinfo=timezone.utc)
+    
+    assert get_date_range_for_today(morning) is get_date_range_for_today(evening)
+    assert get_date_range_for_week(morning) is get_date_range_for_week(evening)
+    
+    assert get_date_range_for_month(evening) == (
+        "2026-12-01T00:00:00+00:00", "2027-01-01T00:00:00+00:00"
+    )
+    
+    dates = get_week_dates()
+    dates.clear()
+    assert len(get_week_dates()) == 7
+
+
 def test_get_week_dates():
     """Test getting all dates in current week."""
     dates = get_week_dates()
@@ -80,6 +119,9 @@ def test_format_date():
     assert "Jan" in formatted
     assert "11" in formatted
     assert "2026" in formatted
+    
+    # Any time on the same day reuses the memoized label
+    assert format_date(dt.replace(hour=0, minute=0)) is formatted
 
 
 def test_format_datetime():
@@ -92,17 +134,30 @@ def test_format_datetime():
     assert "PM" in formatted or "AM" in formatted
 
 
-def test_get_default_export_path():
+def test_get_default_export_path(tmp_path, monkeypatch):
     """Test getting default export path."""
     from src.utils.export import get_default_export_path
-    import os
     
+    monkeypatch.setenv("HOME", str(tmp_path))
     export_path = get_default_export_path()
     assert export_path.exists()
     assert export_path.is_dir()
     assert "context-timer-exports" in str(export_path)
 
 
+def test_get_default_export_path_recreates_directory(tmp_path, monkeypatch):
+    """Test that a deleted export directory is created again on the next export."""
+    from src.utils.export import get_default_export_path
+    
+    monkeypatch.setenv("HOME", str(tmp_path))
+    export_path = get_default_export_path()
+    assert export_path == tmp_path / "Documents" / "context-timer-exports"
+    
+    export_path.rmdir()
+    assert get_default_export_path() == export_path
+    assert export_path.is_dir()
+
+
 def test_generate_export_filename():
     """Test generating export filenames."""
     from src.utils.export import generate_export_filename
@@ -112,14 +167,17 @@ def test_generate_export_filename():
     assert "20260112" in filename
     assert filename.endswith(".csv")
     assert len(filename) > 20  # Should have timestamp
+    
+    now = datetime(2026, 1, 12, 23, 59, 59, tzinfo=timezone.utc)
+    assert generate_export_filename("daily", now=now) == "context-timer-daily-20260112-235959.csv"
+    assert generate_export_filename("weekly", "20260112-week", now=now) == \
+        "context-timer-weekly-20260112-week-235959.csv"
 
 
-def test_export_sessions_to_csv():
+def test_export_sessions_to_csv(tmp_path):
     """Test exporting sessions to CSV."""
     from src.utils.export import export_sessions_to_csv
-    import tempfile
     import csv
-    import os
     
     # Create test data
     session_data = [
@@ -132,29 +190,67 @@ def test_export_sessions_to_csv():
         }
     ]
     
-    # Export to temp file
-    fd, path = tempfile.mkstemp(suffix='.csv')
-    os.close(fd)
-    
-    try:
-        export_sessions_to_csv(session_data, path)
-        
-        # Verify file contents
-        with open(path, 'r') as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
-            assert len(rows) == 1
-            assert rows[0]['Task Name'] == 'Test Task'
-            assert rows[0]['Start Time'] == '2026-01-12 09:00:00'
-            assert rows[0]['Duration (seconds)'] == '3600'
-    finally:
-        os.unlink(path)
+    path = tmp_path / "sessions.csv"
+    export_sessions_to_csv(session_data, path)
+    
+    # Verify file contents
+    with open(path, 'r') as f:
+        reader = csv.DictReader(f)
+        rows = list(reader)
+        assert len(rows) == 1
+        assert rows[0]['Task Name'] == 'Test Task'
+        assert rows[0]['Start Time'] == '2026-01-12 09:00:00'
+        assert rows[0]['Duration (seconds)'] == '3600'
+
+
+def test_export_sessions_to_csv_from_generator(tmp_path):
+    """Test exporting sessions streamed from a generator to a Path."""
+    from src.utils.export import export_sessions_to_csv
+    import csv
+    
+    path = tmp_path / "sessions.csv"
+    assert export_sessions_to_csv((row for row in []), path) == 0
+    
+    with open(path, 'r') as f:
+        rows = list(csv.reader(f))
+    assert rows == [['Task Name', 'Start Time', 'End Time', 'Duration (seconds)', 'Duration (HH:MM:SS)']]
+
+
+def test_export_session_rows_to_csv(tmp_path):
+    """Test exporting session tuples in column order."""
+    from src.utils.export import export_session_rows_to_csv
+    import csv
+    
+    path = tmp_path / "sessions.csv"
+    written = export_session_rows_to_csv(
+        (row for row in [('Test Task', '2026-01-12 09:00:00', 'Running', 60, '00:01:00')]), path
+    )
+    assert written == 1
+    
+    with open(path, 'r') as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 1
+    assert rows[0]['Task Name'] == 'Test Task'
+    assert rows[0]['End Time'] == 'Running'
+    assert rows[0]['Duration (HH:MM:SS)'] == '00:01:00'
+
+
+def test_format_session_export_rows():
+    """Test formatting raw session rows for CSV export."""
+    from src.utils.export import format_session_export_rows
+    
+    rows = format_session_export_rows([
+        ('Task', '2026-01-12T09:00:00.123456+00:00', '2026-01-12T10:00:00+00:00', 3600),
+        (None, '2026-01-12T11:00:00+00:00', None, 61),
+    ])
+    assert list(rows) == [
+        ('Task', '2026-01-12 09:00:00', '2026-01-12 10:00:00', 3600, '01:00:00'),
+        ('Unknown', '2026-01-12 11:00:00', 'Running', 61, '00:01:01'),
+    ]
 
 
 def test_get_date_range_for_month():
     """Test getting date range for current month."""
-    from src.utils.time_utils import get_date_range_for_month
-    
     start, end = get_date_range_for_month()
     
     start_dt = datetime.fromisoformat(start)